@@ -1,34 +1,104 @@
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connection
+from django.utils.functional import cached_property
+
 from .models import Persona, OnePager, AccountPlan, Citation
 
 
+class EstimatedCountPaginator(Paginator):
+    """Paginator that answers count() from Postgres planner statistics.
+
+    The admin changelist issues a full-table COUNT(*) on every page load,
+    which is a sequential scan on large tables. For unfiltered lists on
+    Postgres, read the reltuples estimate from pg_class instead; fall back
+    to an exact count on other backends or when filters are applied.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if connection.vendor == 'postgresql' and not queryset.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+                # reltuples is -1 until the table has been analyzed
+                if row is not None and row[0] >= 0:
+                    return int(row[0])
+        return super().count
+
+
 @admin.register(Persona)
 class PersonaAdmin(admin.ModelAdmin):
     list_display = ['id', 'name', 'title', 'research_job', 'seniority_level', 'created_at']
     list_filter = ['seniority_level', 'created_at']
-    search_fields = ['name', 'title', 'background']
+    list_select_related = ['research_job']
+    # Prefix match so the search can use the plain b-tree indexes on
+    # these columns; icontains would scan regardless of index.
+    search_fields = ['^name', '^title']
     readonly_fields = ['id', 'created_at', 'updated_at']
+    list_per_page = 25
+    show_full_result_count = False
 
 
 @admin.register(OnePager)
 class OnePagerAdmin(admin.ModelAdmin):
     list_display = ['id', 'title', 'research_job', 'status', 'created_at']
     list_filter = ['status', 'created_at']
-    search_fields = ['title', 'headline', 'executive_summary']
+    list_select_related = ['research_job']
+    search_fields = ['^title']
     readonly_fields = ['id', 'created_at', 'updated_at']
+    list_per_page = 25
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request).select_related('research_job')
+        # Defer the large HTML/section TextFields only on the changelist,
+        # which never shows them; the change form reads most columns, so
+        # deferring there would refetch each one in its own SELECT.
+        match = request.resolver_match
+        if match is not None and match.url_name.endswith('_changelist'):
+            qs = qs.only(
+                'id', 'title', 'status', 'created_at',
+                'research_job__client_name', 'research_job__status',
+            )
+        return qs
 
 
 @admin.register(AccountPlan)
 class AccountPlanAdmin(admin.ModelAdmin):
     list_display = ['id', 'title', 'research_job', 'status', 'created_at']
     list_filter = ['status', 'created_at']
-    search_fields = ['title', 'executive_summary']
+    list_select_related = ['research_job']
+    search_fields = ['^title']
     readonly_fields = ['id', 'created_at', 'updated_at']
+    paginator = EstimatedCountPaginator
+    list_per_page = 25
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request).select_related('research_job')
+        # Defer the large HTML/section TextFields only on the changelist,
+        # which never shows them; the change form reads most columns, so
+        # deferring there would refetch each one in its own SELECT.
+        match = request.resolver_match
+        if match is not None and match.url_name.endswith('_changelist'):
+            qs = qs.only(
+                'id', 'title', 'status', 'created_at',
+                'research_job__client_name', 'research_job__status',
+            )
+        return qs
 
 
 @admin.register(Citation)
 class CitationAdmin(admin.ModelAdmin):
     list_display = ['id', 'title', 'citation_type', 'source', 'research_job', 'verified', 'created_at']
     list_filter = ['citation_type', 'verified', 'created_at']
-    search_fields = ['title', 'source', 'excerpt']
+    list_select_related = ['research_job']
+    search_fields = ['^title', '^source']
     readonly_fields = ['id', 'created_at']
+    list_per_page = 25
+    show_full_result_count = False
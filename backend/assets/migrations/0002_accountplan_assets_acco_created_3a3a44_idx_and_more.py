@@ -0,0 +1,54 @@
+# Generated by Django 5.2.17 on 2026-08-27 12:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assets', '0001_initial'),
+        ('research', '0009_add_partial_status_and_synthesis_text'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='accountplan',
+            index=models.Index(fields=['-created_at'], name='assets_acco_created_3a3a44_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='accountplan',
+            index=models.Index(fields=['status', '-created_at'], name='assets_acco_status_99534e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='citation',
+            index=models.Index(fields=['-created_at'], name='assets_cita_created_e82bf1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='citation',
+            index=models.Index(fields=['citation_type', '-created_at'], name='assets_cita_citatio_978592_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='citation',
+            index=models.Index(fields=['verified', '-created_at'], name='assets_cita_verifie_a62671_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='onepager',
+            index=models.Index(fields=['-created_at'], name='assets_onep_created_7591a8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='onepager',
+            index=models.Index(fields=['status', '-created_at'], name='assets_onep_status_423ee4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='onepager',
+            index=models.Index(fields=['research_job', '-created_at'], name='assets_onep_researc_a9ac79_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='persona',
+            index=models.Index(fields=['-created_at'], name='assets_pers_created_b7d1fa_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='persona',
+            index=models.Index(fields=['seniority_level', '-created_at'], name='assets_pers_seniori_a27a85_idx'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+"""Postgres GIN indexes for containment queries on asset JSONFields.
+
+Queries like Persona.objects.filter(goals__contains=[...]) emit the
+jsonb @> operator, which these jsonb_path_ops GIN indexes serve in
+O(log N) instead of deserializing every row. No-op on SQLite.
+"""
+from django.db import migrations
+
+GIN_INDEXES = [
+    ('assets_persona_goals_gin', 'assets_persona', 'goals'),
+    ('assets_persona_challenges_gin', 'assets_persona', 'challenges'),
+    ('assets_onepager_differentiators_gin', 'assets_onepager', 'differentiators'),
+    ('assets_accountplan_objectives_gin', 'assets_accountplan', 'strategic_objectives'),
+    ('assets_accountplan_valueprops_gin', 'assets_accountplan', 'value_propositions'),
+]
+
+
+def create_gin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, column in GIN_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} USING GIN ({column} jsonb_path_ops)'
+        )
+
+
+def drop_gin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _table, _column in GIN_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assets', '0002_accountplan_assets_acco_created_3a3a44_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_gin_indexes, drop_gin_indexes),
+    ]
@@ -0,0 +1,53 @@
+"""Switch big text columns to LZ4 TOAST compression on Postgres 14+.
+
+html_content and the long section fields dominate row size on OnePager
+and AccountPlan. LZ4 decompresses several times faster than the default
+pglz, which speeds up every fetch of these columns. No-op on SQLite and
+on Postgres < 14.
+"""
+from django.db import migrations
+
+COMPRESSED_COLUMNS = [
+    ('assets_onepager', 'html_content'),
+    ('assets_onepager', 'executive_summary'),
+    ('assets_accountplan', 'html_content'),
+    ('assets_accountplan', 'executive_summary'),
+    ('assets_accountplan', 'account_overview'),
+]
+
+
+def _supports_lz4(connection):
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute('SHOW server_version_num')
+        return int(cursor.fetchone()[0]) >= 140000
+
+
+def set_lz4_compression(apps, schema_editor):
+    if not _supports_lz4(schema_editor.connection):
+        return
+    for table, column in COMPRESSED_COLUMNS:
+        schema_editor.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION lz4'
+        )
+
+
+def reset_compression(apps, schema_editor):
+    if not _supports_lz4(schema_editor.connection):
+        return
+    for table, column in COMPRESSED_COLUMNS:
+        schema_editor.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION DEFAULT'
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assets', '0003_jsonfield_gin_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(set_lz4_compression, reset_compression),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.17 on 2026-08-27 13:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assets', '0004_lz4_compression_for_text_columns'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='accountplan',
+            name='title',
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='citation',
+            name='source',
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='citation',
+            name='title',
+            field=models.CharField(db_index=True, max_length=500),
+        ),
+        migrations.AlterField(
+            model_name='onepager',
+            name='title',
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='persona',
+            name='name',
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='persona',
+            name='title',
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+    ]
@@ -15,8 +15,8 @@ class Persona(models.Model):
     )
 
     # Persona identity
-    name = models.CharField(max_length=255)
-    title = models.CharField(max_length=255)
+    name = models.CharField(max_length=255, db_index=True)
+    title = models.CharField(max_length=255, db_index=True)
     department = models.CharField(max_length=100, blank=True)
     seniority_level = models.CharField(max_length=50, blank=True)
 
@@ -41,6 +41,10 @@ class Persona(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['seniority_level', '-created_at']),
+        ]
 
     def __str__(self):
         return f"{self.name} - {self.title}"
@@ -64,7 +68,7 @@ class OnePager(models.Model):
     )
 
     # Document content
-    title = models.CharField(max_length=255)
+    title = models.CharField(max_length=255, db_index=True)
     headline = models.CharField(max_length=500)
     executive_summary = models.TextField()
 
@@ -92,6 +96,11 @@ class OnePager(models.Model):
     class Meta:
         ordering = ['-created_at']
         verbose_name_plural = 'One pagers'
+        indexes = [
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['status', '-created_at']),
+            models.Index(fields=['research_job', '-created_at']),
+        ]
 
     def __str__(self):
         return f"One-Pager: {self.title}"
@@ -116,7 +125,7 @@ class AccountPlan(models.Model):
     )
 
     # Executive summary
-    title = models.CharField(max_length=255)
+    title = models.CharField(max_length=255, db_index=True)
     executive_summary = models.TextField()
 
     # Account overview
@@ -152,6 +161,10 @@ class AccountPlan(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['status', '-created_at']),
+        ]
 
     def __str__(self):
         return f"Account Plan: {self.title}"
@@ -179,8 +192,8 @@ class Citation(models.Model):
 
     # Citation details
     citation_type = models.CharField(max_length=50, choices=CITATION_TYPES)
-    title = models.CharField(max_length=500)
-    source = models.CharField(max_length=255)
+    title = models.CharField(max_length=500, db_index=True)
+    source = models.CharField(max_length=255, db_index=True)
     url = models.URLField(blank=True)
     author = models.CharField(max_length=255, blank=True)
     publication_date = models.DateField(null=True, blank=True)
@@ -198,6 +211,11 @@ class Citation(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['citation_type', '-created_at']),
+            models.Index(fields=['verified', '-created_at']),
+        ]
 
     def __str__(self):
         return f"{self.citation_type}: {self.title[:50]}"
@@ -1,13 +1,35 @@
 """Account plan generation service (AGE-23)."""
+import hashlib
 import json
 import logging
-from dataclasses import dataclass, field
-from typing import List, Dict
+import re
+import string
+
+import orjson
+from dataclasses import asdict, dataclass, field
+from typing import List, Dict, Tuple
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from research.services.gemini import GeminiClient
+
+from ..models import AccountPlan
 
 logger = logging.getLogger(__name__)
 
+# How long to keep raw Gemini responses cached (seconds).
+RESPONSE_CACHE_TTL = 86400
+
+# One GeminiClient per worker process; fresh generator instances reuse it
+# instead of re-initializing the SDK per job.
+_shared_gemini_client = None
+
+# Matches a fenced response like ```json\n{...}\n``` and captures the body.
+_FENCE_RE = re.compile(r'^```(?:json)?\s*\n(.*?)\n```\s*$', re.DOTALL)
+
 
-@dataclass
+@dataclass(slots=True)
 class AccountPlanData:
     """Data structure for an account plan."""
     title: str = ""
@@ -29,52 +51,52 @@ class AccountPlanData:
 class AccountPlanGenerator:
     """Service to generate strategic account plans."""
 
-    ACCOUNT_PLAN_PROMPT = '''You are a strategic account planning expert.
+    ACCOUNT_PLAN_PROMPT = string.Template('''You are a strategic account planning expert.
 
 Based on the following research:
-- Company: {client_name}
-- Industry: {vertical}
-- Company Overview: {company_overview}
-- Decision Makers: {decision_makers}
-- Pain Points: {pain_points}
-- Opportunities: {opportunities}
-- Strategic Goals: {strategic_goals}
-- Digital Maturity: {digital_maturity}
-- Competitor Case Studies: {competitor_info}
-- Gap Analysis: {gap_info}
+- Company: ${client_name}
+- Industry: ${vertical}
+- Company Overview: ${company_overview}
+- Decision Makers: ${decision_makers}
+- Pain Points: ${pain_points}
+- Opportunities: ${opportunities}
+- Strategic Goals: ${strategic_goals}
+- Digital Maturity: ${digital_maturity}
+- Competitor Case Studies: ${competitor_info}
+- Gap Analysis: ${gap_info}
 
 Create a comprehensive strategic account plan.
 
 Respond with valid JSON:
-{{
+{
     "title": "Account Plan: Company Name",
     "executive_summary": "Executive summary of the account strategy",
     "account_overview": "Overview of the account and relationship",
     "strategic_objectives": ["Objective 1", "Objective 2", "Objective 3"],
     "key_stakeholders": [
-        {{"name": "Name", "title": "Title", "role_in_decision": "Champion/Influencer/Blocker", "engagement_approach": "How to engage"}}
+        {"name": "Name", "title": "Title", "role_in_decision": "Champion/Influencer/Blocker", "engagement_approach": "How to engage"}
     ],
     "opportunities": [
-        {{"name": "Opportunity name", "value": "$100K-500K", "timeline": "Q3 2025", "probability": "60%"}}
+        {"name": "Opportunity name", "value": "$$100K-500K", "timeline": "Q3 2025", "probability": "60%"}
     ],
     "competitive_landscape": "Analysis of competitive positioning",
-    "swot_analysis": {{
+    "swot_analysis": {
         "strengths": ["Strength 1", "Strength 2"],
         "weaknesses": ["Weakness 1", "Weakness 2"],
         "opportunities": ["Opportunity 1", "Opportunity 2"],
         "threats": ["Threat 1", "Threat 2"]
-    }},
+    },
     "engagement_strategy": "Overall engagement strategy",
     "value_propositions": ["Value prop 1", "Value prop 2"],
     "action_plan": [
-        {{"action": "Action item", "owner": "Sales rep", "due_date": "Within 30 days", "status": "Not started"}}
+        {"action": "Action item", "owner": "Sales rep", "due_date": "Within 30 days", "status": "Not started"}
     ],
     "success_metrics": ["Metric 1", "Metric 2"],
     "milestones": [
-        {{"milestone": "Milestone name", "target_date": "Within 60 days", "criteria": "Success criteria"}}
+        {"milestone": "Milestone name", "target_date": "Within 60 days", "criteria": "Success criteria"}
     ],
     "timeline": "Overall timeline description"
-}}
+}
 
 IMPORTANT:
 - Be strategic and actionable
@@ -82,7 +104,7 @@ IMPORTANT:
 - Provide realistic timelines
 - Use realistic future dates relative to the current date, not hardcoded past dates
 - Respond ONLY with valid JSON
-'''
+''')
 
     def __init__(self, gemini_client=None):
         """Initialize with optional Gemini client."""
@@ -90,23 +112,25 @@ IMPORTANT:
 
     @property
     def gemini_client(self):
-        """Lazy initialization of Gemini client."""
+        """Lazy initialization of Gemini client, shared across instances."""
         if self._gemini_client is None:
-            from research.services.gemini import GeminiClient
-            self._gemini_client = GeminiClient()
+            global _shared_gemini_client
+            if _shared_gemini_client is None:
+                _shared_gemini_client = GeminiClient()
+            self._gemini_client = _shared_gemini_client
         return self._gemini_client
 
-    def generate_account_plan(self, research_job) -> AccountPlanData:
-        """Generate an account plan from research.
+    def build_prompt(self, research_job) -> str:
+        """Build the account plan prompt without calling the LLM.
 
         Args:
             research_job: ResearchJob model instance
 
         Returns:
-            AccountPlanData object
+            Formatted prompt string
         """
-        report = getattr(research_job, 'report', None)
-        gap_analysis = getattr(research_job, 'gap_analysis', None)
+        report = research_job.report_or_none
+        gap_analysis = research_job.gap_analysis_or_none
 
         # Format decision makers
         decision_makers = "Not identified"
@@ -119,11 +143,7 @@ IMPORTANT:
                     dms.append(str(dm))
             decision_makers = ', '.join(dms)
 
-        # Format competitor info
-        competitor_info = "Not analyzed"
-        competitor_studies = research_job.competitor_case_studies.all()[:3]
-        if competitor_studies:
-            competitor_info = ', '.join([cs.competitor_name for cs in competitor_studies])
+        competitor_info = self._format_competitor_info(research_job)
 
         # Format gap info
         gap_info = "Not analyzed"
@@ -144,18 +164,26 @@ IMPORTANT:
             'gap_info': gap_info,
         }
 
-        prompt = self.ACCOUNT_PLAN_PROMPT.format(**context)
+        return self.ACCOUNT_PLAN_PROMPT.substitute(context)
 
-        try:
-            response = self.gemini_client.generate_text(prompt)
+    def parse_account_plan(self, response: str, research_job) -> AccountPlanData:
+        """Parse an LLM response into AccountPlanData; default-titled on bad output.
 
+        Args:
+            response: Raw response text from the LLM
+            research_job: ResearchJob used for the fallback title
+
+        Returns:
+            AccountPlanData object
+        """
+        try:
             # Parse JSON response
             response_text = response.strip()
-            if response_text.startswith('```'):
-                lines = response_text.split('\n')
-                response_text = '\n'.join(lines[1:-1])
+            fence_match = _FENCE_RE.match(response_text)
+            if fence_match:
+                response_text = fence_match.group(1)
 
-            data = json.loads(response_text)
+            data = orjson.loads(response_text)
 
             return AccountPlanData(
                 title=data.get('title', ''),
@@ -174,13 +202,81 @@ IMPORTANT:
                 timeline=data.get('timeline', ''),
             )
 
-        except json.JSONDecodeError as e:
+        except (orjson.JSONDecodeError, json.JSONDecodeError) as e:
             logger.error(f"Failed to parse account plan response: {e}")
             return AccountPlanData(title=f"Account Plan: {research_job.client_name}")
+        except Exception as e:
+            logger.exception("Error parsing account plan response")
+            return AccountPlanData(title=f"Account Plan: {research_job.client_name}")
+
+    def generate_account_plan(self, research_job) -> AccountPlanData:
+        """Generate an account plan from research.
+
+        Args:
+            research_job: ResearchJob model instance
+
+        Returns:
+            AccountPlanData object
+        """
+        prompt = self.build_prompt(research_job)
+
+        try:
+            response = self._generate_with_cache(prompt)
         except Exception as e:
             logger.exception("Error during account plan generation")
             return AccountPlanData(title=f"Account Plan: {research_job.client_name}")
 
+        return self.parse_account_plan(response, research_job)
+
+    def _format_competitor_info(self, research_job) -> str:
+        """Produce the joined competitor-name string for the prompt.
+
+        Prefetched case studies are read straight from cache. Without a
+        prefetch, on Postgres the join is pushed into the database with
+        string_agg so no rows are materialized; elsewhere fall back to
+        fetching and joining in Python.
+        """
+        prefetched = getattr(research_job, '_prefetched_objects_cache', None) or {}
+        if 'competitor_case_studies' not in prefetched:
+            from django.db import connection, models
+
+            if isinstance(research_job, models.Model) and connection.vendor == 'postgresql':
+                from django.contrib.postgres.aggregates import StringAgg
+
+                # Aggregate over the same top three rows (in the model's
+                # default ordering) that the Python path takes, so the
+                # prompt text — and the response-cache key derived from
+                # it — is identical on every backend.
+                studies = research_job.competitor_case_studies
+                joined = (
+                    studies.model.objects
+                    .filter(pk__in=studies.values('pk')[:3])
+                    .aggregate(names=StringAgg(
+                        'competitor_name', ', ',
+                        ordering=('-relevance_score', '-created_at'),
+                    ))['names']
+                )
+                return joined or "Not analyzed"
+
+        competitor_studies = list(research_job.competitor_case_studies.all())[:3]
+        if competitor_studies:
+            return ', '.join(cs.competitor_name for cs in competitor_studies)
+        return "Not analyzed"
+
+    def _generate_with_cache(self, prompt: str) -> str:
+        """Call Gemini for the prompt, memoizing the raw response.
+
+        The prompt is deterministic in the research job's report and gap
+        analysis content, so retries and regenerations for unchanged
+        research can skip the multi-second LLM call entirely.
+        """
+        key = 'acctplan:' + hashlib.sha256(prompt.encode()).hexdigest()
+        response = cache.get(key)
+        if response is None:
+            response = self.gemini_client.generate_text(prompt)
+            cache.set(key, response, timeout=RESPONSE_CACHE_TTL)
+        return response
+
     def create_account_plan_model(self, research_job, plan_data: AccountPlanData):
         """Create AccountPlan model instance.
 
@@ -191,26 +287,54 @@ IMPORTANT:
         Returns:
             Created AccountPlan instance
         """
-        from ..models import AccountPlan
-
-        plan, created = AccountPlan.objects.update_or_create(
-            research_job=research_job,
-            defaults={
-                'title': plan_data.title,
-                'executive_summary': plan_data.executive_summary,
-                'account_overview': plan_data.account_overview,
-                'strategic_objectives': plan_data.strategic_objectives,
-                'key_stakeholders': plan_data.key_stakeholders,
-                'opportunities': plan_data.opportunities,
-                'competitive_landscape': plan_data.competitive_landscape,
-                'swot_analysis': plan_data.swot_analysis,
-                'engagement_strategy': plan_data.engagement_strategy,
-                'value_propositions': plan_data.value_propositions,
-                'action_plan': plan_data.action_plan,
-                'success_metrics': plan_data.success_metrics,
-                'milestones': plan_data.milestones,
-                'timeline': plan_data.timeline,
-            }
+        defaults = {
+            'title': plan_data.title,
+            'executive_summary': plan_data.executive_summary,
+            'account_overview': plan_data.account_overview,
+            'strategic_objectives': plan_data.strategic_objectives,
+            'key_stakeholders': plan_data.key_stakeholders,
+            'opportunities': plan_data.opportunities,
+            'competitive_landscape': plan_data.competitive_landscape,
+            'swot_analysis': plan_data.swot_analysis,
+            'engagement_strategy': plan_data.engagement_strategy,
+            'value_propositions': plan_data.value_propositions,
+            'action_plan': plan_data.action_plan,
+            'success_metrics': plan_data.success_metrics,
+            'milestones': plan_data.milestones,
+            'timeline': plan_data.timeline,
+        }
+
+        # Regeneration is the hot path: a direct UPDATE is one round-trip,
+        # versus update_or_create's SELECT + UPDATE. update() bypasses
+        # auto_now, so stamp updated_at explicitly.
+        updated = AccountPlan.objects.filter(research_job=research_job).update(
+            updated_at=timezone.now(), **defaults
         )
+        if updated:
+            return AccountPlan.objects.get(research_job=research_job)
+        return AccountPlan.objects.create(research_job=research_job, **defaults)
+
+    def bulk_create_account_plans(self, pairs: List[Tuple[object, AccountPlanData]]):
+        """Persist many (research_job, plan_data) pairs in one statement.
 
-        return plan
+        Uses INSERT ... ON CONFLICT DO UPDATE via bulk_create, so saving N
+        plans costs one round-trip instead of the 2N a per-job upsert loop
+        would issue.
+
+        Args:
+            pairs: iterable of (ResearchJob, AccountPlanData) tuples
+
+        Returns:
+            List of AccountPlan instances
+        """
+        plan_fields = [f.name for f in AccountPlanData.__dataclass_fields__.values()]
+        objs = [
+            AccountPlan(research_job=research_job, **asdict(plan_data))
+            for research_job, plan_data in pairs
+        ]
+        return AccountPlan.objects.bulk_create(
+            objs,
+            update_conflicts=True,
+            unique_fields=['research_job'],
+            update_fields=plan_fields,
+        )
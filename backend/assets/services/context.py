@@ -0,0 +1,64 @@
+"""Shared prompt-context assembly for asset generators."""
+
+# Memoized contexts keyed by (pk, updated_at): generating personas, a
+# one-pager, and an account plan for the same job does the field-joining
+# work once instead of once per generator.
+_CACHE_MAX = 128
+_context_cache = {}
+
+
+def _compute_context(research_job) -> dict:
+    report = research_job.report_or_none
+
+    # Format decision makers
+    decision_makers = "Not identified"
+    if report and report.decision_makers:
+        dms = []
+        for dm in report.decision_makers[:5]:
+            if isinstance(dm, dict):
+                dms.append(f"{dm.get('name', '')} ({dm.get('title', '')})")
+            else:
+                dms.append(str(dm))
+        decision_makers = ', '.join(dms)
+
+    return {
+        'client_name': research_job.client_name,
+        'vertical': research_job.vertical or 'unknown',
+        'decision_makers': decision_makers,
+        'pain_points': ', '.join(report.pain_points[:5]) if report and report.pain_points else 'Not identified',
+        'opportunities': ', '.join(report.opportunities[:3]) if report and report.opportunities else 'Not identified',
+        'strategic_goals': ', '.join(report.strategic_goals[:5]) if report and report.strategic_goals else 'Not identified',
+        'digital_maturity': report.digital_maturity if report else 'unknown',
+    }
+
+
+def build_research_context(research_job) -> dict:
+    """Return the joined prompt-context fields for a research job.
+
+    Results are memoized per (pk, updated_at), so the cache invalidates
+    itself whenever the job row changes. Jobs without both attributes
+    (e.g. unsaved instances) are computed fresh each call.
+
+    Args:
+        research_job: ResearchJob model instance
+
+    Returns:
+        Dict of pre-joined context strings
+    """
+    pk = getattr(research_job, 'pk', None)
+    updated_at = getattr(research_job, 'updated_at', None)
+    key = (pk, updated_at) if pk is not None and updated_at is not None else None
+
+    if key is not None:
+        context = _context_cache.get(key)
+        if context is not None:
+            return context
+
+    context = _compute_context(research_job)
+
+    if key is not None:
+        if len(_context_cache) >= _CACHE_MAX:
+            # Drop the oldest entry; insertion order approximates LRU here.
+            _context_cache.pop(next(iter(_context_cache)))
+        _context_cache[key] = context
+    return context
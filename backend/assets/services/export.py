@@ -1,140 +1,338 @@
 """Export service for generating PDFs and HTML (AGE-24)."""
-import html
+import functools
+import glob
+import heapq
+import io
 import logging
 import os
 from datetime import datetime
+from operator import itemgetter
+from pathlib import Path
 from typing import Optional
 from django.conf import settings
+from jinja2 import Environment, BaseLoader, select_autoescape
+from markupsafe import escape as _escape
+
+from research.constants import AIAdoptionStage, DigitalMaturityLevel
 
 logger = logging.getLogger(__name__)
 
+# Display labels for the enum-like report fields, precomputed so the hot
+# export path does not re-run str.replace + str.title per call.
+_DISPLAY_LABELS = {
+    member.value: member.value.replace('_', ' ').title()
+    for enum in (DigitalMaturityLevel, AIAdoptionStage)
+    for member in enum
+}
+
+
+def _display_label(value: str) -> str:
+    """Human-readable label for an enum-like snake_case value."""
+    return _DISPLAY_LABELS.get(value) or value.replace('_', ' ').title()
+
+
+# Export directory, resolved and created once per process instead of a
+# path join + makedirs stat on every PDF export.
+_export_dir = None
+
+
+def _get_export_dir() -> Path:
+    global _export_dir
+    if _export_dir is None:
+        path = Path(settings.BASE_DIR) / 'exports'
+        path.mkdir(parents=True, exist_ok=True)
+        _export_dir = path
+    return _export_dir
+
+
+# Media subdirectories holding on-disk copies of generated asset HTML.
+ONE_PAGER_HTML_DIR = 'one_pagers'
+ACCOUNT_PLAN_HTML_DIR = 'account_plans'
+
+
+def asset_html_path(subdir: str, pk) -> Optional[str]:
+    """On-disk path for a generated asset document, or None.
+
+    The file is a read-optimized copy of the model's html_content: views
+    can hand it to FileResponse (wsgi.file_wrapper / sendfile) instead of
+    pulling the text column through the ORM on every read.
+    """
+    if pk is None:
+        return None
+    media_root = getattr(settings, 'MEDIA_ROOT', None)
+    if not media_root:
+        return None
+    return os.path.join(media_root, subdir, f'{pk}.html')
+
+
+def _write_asset_html(path: str, result_html: str) -> None:
+    """Atomically write a generated asset document to disk."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as tmp_file:
+            tmp_file.write(result_html)
+        os.replace(tmp_path, path)
+    except OSError:
+        logger.warning("Could not write asset HTML %s", path, exc_info=True)
+
+
+# WeasyPrint font discovery (a fontconfig probe) is one of the dominant
+# costs of small exports; share one FontConfiguration per worker process.
+_font_config = None
+
+
+def _get_font_config():
+    global _font_config
+    if _font_config is None:
+        from weasyprint.text.fonts import FontConfiguration
+        _font_config = FontConfiguration()
+    return _font_config
+
+
+def _render_pdf_blocking(html_content: str, output_path: str) -> None:
+    """Render a PDF to disk; module-level so it is picklable for the pool."""
+    from weasyprint import HTML
+
+    # Stream pages to the open file instead of materializing the
+    # whole PDF in memory first.
+    with open(output_path, 'wb') as pdf_file:
+        HTML(string=html_content).write_pdf(
+            target=pdf_file, font_config=_get_font_config()
+        )
+
+
+# Optional process pool so WeasyPrint's CPU-heavy rendering does not hold
+# the GIL in the request process. Enabled via EXPORT_PDF_WORKERS > 0.
+_pdf_pool = None
+
+
+def _get_pdf_pool():
+    global _pdf_pool
+    if _pdf_pool is None:
+        from concurrent.futures import ProcessPoolExecutor
+
+        _pdf_pool = ProcessPoolExecutor(max_workers=settings.EXPORT_PDF_WORKERS)
+    return _pdf_pool
+
+
+# Escape cache for short strings drawn from small vocabularies that repeat
+# across exports (themes, skills, department names).
+_esc_cached = functools.lru_cache(maxsize=4096)(_escape)
+
+
+def _esc_row(d, *keys):
+    """Escape several dict values in one pass; missing values become ''."""
+    return tuple(_escape(d.get(k) or '') for k in keys)
+
+
+_CONF_CLASSES = ('confidence-low', 'confidence-medium', 'confidence-high')
+
+
+def _confidence_badge(score) -> tuple:
+    """Map a 0-1 confidence score to (percentage, css class) in one place."""
+    pct = round(score * 100)
+    # Branchless bucket index: 0 below 40, 1 from 40, 2 from 70.
+    return pct, _CONF_CLASSES[(pct >= 40) + (pct >= 70)]
+
+
+_COMPETITORS_TEMPLATE_SOURCE = '''
+<div class="section"><div class="section-title">Competitor Case Studies</div>
+<p>Found {{ case_studies|length }} relevant competitor case studies:</p>
+<table>
+    <tr>
+        <th>Competitor</th>
+        <th>Case Study</th>
+        <th>Technologies</th>
+        <th>Match</th>
+    </tr>
+{% for cs in case_studies %}
+    <tr>
+        <td><strong>{{ cs.competitor_name }}</strong></td>
+        <td>{{ cs.case_study_title }}<br><small style="color: #666;">{% set s = cs.summary %}{% if s|length > 200 %}{{ s[:200] }}...{% else %}{{ s }}{% endif %}</small></td>
+        <td>{{ cs.technologies_used[:3]|join(', ') if cs.technologies_used else '-' }}</td>
+        <td style="text-align: center;"><strong>{{ (cs.relevance_score * 100)|round|int }}%</strong></td>
+    </tr>
+{% endfor %}
+</table>
+{% for cs in case_studies[:3] %}
+{% if cs.outcomes %}
+<div class="subsection-title">{{ cs.competitor_name }} - Key Outcomes</div>
+<ul>
+{% for outcome in cs.outcomes %}
+    <li style="color: #2e7d32;">{{ outcome }}</li>
+{% endfor %}
+</ul>
+{% endif %}
+{% endfor %}
+</div>
+'''
+
+# Shared Jinja environment: templates are compiled once at import and
+# autoescape replaces the per-field html.escape calls the old
+# str.format-based rendering needed.
+_JINJA_ENV = Environment(
+    loader=BaseLoader(),
+    autoescape=select_autoescape(),
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+
+# Compiled once at import; the per-row escaping and formatting then run in
+# Jinja's generated code instead of an interpreted Python loop.
+_COMPETITORS_TEMPLATE = _JINJA_ENV.from_string(_COMPETITORS_TEMPLATE_SOURCE)
+
 
 class ExportService:
     """Service for exporting assets to HTML and PDF."""
 
-    ONE_PAGER_TEMPLATE = '''
+    ONE_PAGER_TEMPLATE = _JINJA_ENV.from_string('''
 <!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
-    <title>{title}</title>
+    <title>{{ title }}</title>
     <style>
-        body {{ font-family: 'Helvetica Neue', Arial, sans-serif; max-width: 800px; margin: 0 auto; padding: 40px; color: #333; }}
-        .header {{ text-align: center; margin-bottom: 30px; border-bottom: 2px solid #0066cc; padding-bottom: 20px; }}
-        .headline {{ font-size: 24px; color: #0066cc; margin-bottom: 10px; }}
-        .summary {{ font-size: 14px; color: #666; line-height: 1.6; }}
-        .section {{ margin-bottom: 25px; }}
-        .section-title {{ font-size: 16px; font-weight: bold; color: #0066cc; margin-bottom: 10px; text-transform: uppercase; letter-spacing: 1px; }}
-        .section-content {{ font-size: 14px; line-height: 1.6; }}
-        .differentiators {{ list-style: none; padding: 0; }}
-        .differentiators li {{ padding: 8px 0 8px 25px; position: relative; }}
-        .differentiators li:before {{ content: "✓"; position: absolute; left: 0; color: #0066cc; font-weight: bold; }}
-        .cta {{ background: #0066cc; color: white; padding: 15px 25px; border-radius: 5px; text-align: center; margin-top: 30px; }}
-        .next-steps {{ margin-top: 15px; }}
-        .next-steps li {{ margin-bottom: 5px; }}
+        body { font-family: 'Helvetica Neue', Arial, sans-serif; max-width: 800px; margin: 0 auto; padding: 40px; color: #333; }
+        .header { text-align: center; margin-bottom: 30px; border-bottom: 2px solid #0066cc; padding-bottom: 20px; }
+        .headline { font-size: 24px; color: #0066cc; margin-bottom: 10px; }
+        .summary { font-size: 14px; color: #666; line-height: 1.6; }
+        .section { margin-bottom: 25px; }
+        .section-title { font-size: 16px; font-weight: bold; color: #0066cc; margin-bottom: 10px; text-transform: uppercase; letter-spacing: 1px; }
+        .section-content { font-size: 14px; line-height: 1.6; }
+        .differentiators { list-style: none; padding: 0; }
+        .differentiators li { padding: 8px 0 8px 25px; position: relative; }
+        .differentiators li:before { content: "✓"; position: absolute; left: 0; color: #0066cc; font-weight: bold; }
+        .cta { background: #0066cc; color: white; padding: 15px 25px; border-radius: 5px; text-align: center; margin-top: 30px; }
+        .next-steps { margin-top: 15px; }
+        .next-steps li { margin-bottom: 5px; }
     </style>
 </head>
 <body>
     <div class="header">
-        <h1>{title}</h1>
-        <div class="headline">{headline}</div>
+        <h1>{{ title }}</h1>
+        <div class="headline">{{ headline }}</div>
     </div>
 
     <div class="section">
-        <div class="summary">{executive_summary}</div>
+        <div class="summary">{{ executive_summary }}</div>
     </div>
 
     <div class="section">
         <div class="section-title">The Challenge</div>
-        <div class="section-content">{challenge_section}</div>
+        <div class="section-content">{{ challenge_section }}</div>
     </div>
 
     <div class="section">
         <div class="section-title">Our Solution</div>
-        <div class="section-content">{solution_section}</div>
+        <div class="section-content">{{ solution_section }}</div>
     </div>
 
     <div class="section">
         <div class="section-title">Key Benefits</div>
-        <div class="section-content">{benefits_section}</div>
+        <div class="section-content">{{ benefits_section }}</div>
     </div>
 
     <div class="section">
         <div class="section-title">Why Choose Us</div>
         <ul class="differentiators">
-            {differentiators_html}
+            {% for d in differentiators %}
+            <li>{{ d }}</li>
+            {% endfor %}
         </ul>
     </div>
 
-    <div class="cta">{call_to_action}</div>
+    <div class="cta">{{ call_to_action }}</div>
 
     <div class="section next-steps">
         <div class="section-title">Next Steps</div>
         <ol>
-            {next_steps_html}
+            {% for s in next_steps %}
+            <li>{{ s }}</li>
+            {% endfor %}
         </ol>
     </div>
 </body>
 </html>
-'''
+''')
 
-    ACCOUNT_PLAN_TEMPLATE = '''
+    ACCOUNT_PLAN_TEMPLATE = _JINJA_ENV.from_string('''
 <!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
-    <title>{title}</title>
+    <title>{{ title }}</title>
     <style>
-        body {{ font-family: 'Helvetica Neue', Arial, sans-serif; max-width: 900px; margin: 0 auto; padding: 40px; color: #333; }}
-        .header {{ text-align: center; margin-bottom: 30px; border-bottom: 3px solid #0066cc; padding-bottom: 20px; }}
-        h1 {{ color: #0066cc; }}
-        .executive-summary {{ background: #f5f5f5; padding: 20px; border-radius: 5px; margin-bottom: 30px; }}
-        .section {{ margin-bottom: 30px; page-break-inside: avoid; }}
-        .section-title {{ font-size: 18px; font-weight: bold; color: #0066cc; margin-bottom: 15px; border-bottom: 1px solid #ddd; padding-bottom: 5px; }}
-        .section-content {{ font-size: 14px; line-height: 1.6; }}
-        table {{ width: 100%; border-collapse: collapse; margin-top: 10px; }}
-        th, td {{ border: 1px solid #ddd; padding: 10px; text-align: left; font-size: 13px; }}
-        th {{ background: #0066cc; color: white; }}
-        .swot {{ display: grid; grid-template-columns: 1fr 1fr; gap: 15px; }}
-        .swot-box {{ padding: 15px; border-radius: 5px; }}
-        .strengths {{ background: #e8f5e9; }}
-        .weaknesses {{ background: #ffebee; }}
-        .opportunities {{ background: #e3f2fd; }}
-        .threats {{ background: #fff3e0; }}
-        .swot-title {{ font-weight: bold; margin-bottom: 10px; }}
-        ul {{ margin: 0; padding-left: 20px; }}
+        body { font-family: 'Helvetica Neue', Arial, sans-serif; max-width: 900px; margin: 0 auto; padding: 40px; color: #333; }
+        .header { text-align: center; margin-bottom: 30px; border-bottom: 3px solid #0066cc; padding-bottom: 20px; }
+        h1 { color: #0066cc; }
+        .executive-summary { background: #f5f5f5; padding: 20px; border-radius: 5px; margin-bottom: 30px; }
+        .section { margin-bottom: 30px; page-break-inside: avoid; }
+        .section-title { font-size: 18px; font-weight: bold; color: #0066cc; margin-bottom: 15px; border-bottom: 1px solid #ddd; padding-bottom: 5px; }
+        .section-content { font-size: 14px; line-height: 1.6; }
+        table { width: 100%; border-collapse: collapse; margin-top: 10px; }
+        th, td { border: 1px solid #ddd; padding: 10px; text-align: left; font-size: 13px; }
+        th { background: #0066cc; color: white; }
+        .swot { display: grid; grid-template-columns: 1fr 1fr; gap: 15px; }
+        .swot-box { padding: 15px; border-radius: 5px; }
+        .strengths { background: #e8f5e9; }
+        .weaknesses { background: #ffebee; }
+        .opportunities { background: #e3f2fd; }
+        .threats { background: #fff3e0; }
+        .swot-title { font-weight: bold; margin-bottom: 10px; }
+        ul { margin: 0; padding-left: 20px; }
     </style>
 </head>
 <body>
     <div class="header">
-        <h1>{title}</h1>
+        <h1>{{ title }}</h1>
     </div>
 
     <div class="executive-summary">
         <h2>Executive Summary</h2>
-        <p>{executive_summary}</p>
+        <p>{{ executive_summary }}</p>
     </div>
 
     <div class="section">
         <div class="section-title">Account Overview</div>
-        <div class="section-content">{account_overview}</div>
+        <div class="section-content">{{ account_overview }}</div>
     </div>
 
     <div class="section">
         <div class="section-title">Strategic Objectives</div>
         <ul>
-            {strategic_objectives_html}
+            {% for o in strategic_objectives %}
+            <li>{{ o }}</li>
+            {% endfor %}
         </ul>
     </div>
 
     <div class="section">
         <div class="section-title">Key Stakeholders</div>
-        {stakeholders_table}
+        {% if key_stakeholders %}
+        <table>
+            <tr><th>Name</th><th>Title</th><th>Role</th><th>Engagement Approach</th></tr>
+            {% for s in key_stakeholders %}
+            <tr><td>{{ s.get('name', '') }}</td><td>{{ s.get('title', '') }}</td><td>{{ s.get('role_in_decision', '') }}</td><td>{{ s.get('engagement_approach', '') }}</td></tr>
+            {% endfor %}
+        </table>
+        {% else %}
+        <p>No stakeholders identified</p>
+        {% endif %}
     </div>
 
     <div class="section">
         <div class="section-title">Opportunities</div>
-        {opportunities_table}
+        {% if opportunities %}
+        <table>
+            <tr><th>Opportunity</th><th>Value</th><th>Timeline</th><th>Probability</th></tr>
+            {% for o in opportunities %}
+            <tr><td>{{ o.get('name', '') }}</td><td>{{ o.get('value', '') }}</td><td>{{ o.get('timeline', '') }}</td><td>{{ o.get('probability', '') }}</td></tr>
+            {% endfor %}
+        </table>
+        {% else %}
+        <p>No opportunities identified</p>
+        {% endif %}
     </div>
 
     <div class="section">
@@ -142,162 +340,130 @@ class ExportService:
         <div class="swot">
             <div class="swot-box strengths">
                 <div class="swot-title">Strengths</div>
-                <ul>{swot_strengths}</ul>
+                <ul>{% for s in swot.get('strengths', []) %}<li>{{ s }}</li>{% endfor %}</ul>
             </div>
             <div class="swot-box weaknesses">
                 <div class="swot-title">Weaknesses</div>
-                <ul>{swot_weaknesses}</ul>
+                <ul>{% for w in swot.get('weaknesses', []) %}<li>{{ w }}</li>{% endfor %}</ul>
             </div>
             <div class="swot-box opportunities">
                 <div class="swot-title">Opportunities</div>
-                <ul>{swot_opportunities}</ul>
+                <ul>{% for o in swot.get('opportunities', []) %}<li>{{ o }}</li>{% endfor %}</ul>
             </div>
             <div class="swot-box threats">
                 <div class="swot-title">Threats</div>
-                <ul>{swot_threats}</ul>
+                <ul>{% for t in swot.get('threats', []) %}<li>{{ t }}</li>{% endfor %}</ul>
             </div>
         </div>
     </div>
 
     <div class="section">
         <div class="section-title">Engagement Strategy</div>
-        <div class="section-content">{engagement_strategy}</div>
+        <div class="section-content">{{ engagement_strategy }}</div>
     </div>
 
     <div class="section">
         <div class="section-title">Action Plan</div>
-        {action_plan_table}
+        {% if action_plan %}
+        <table>
+            <tr><th>Action</th><th>Owner</th><th>Due Date</th><th>Status</th></tr>
+            {% for a in action_plan %}
+            <tr><td>{{ a.get('action', '') }}</td><td>{{ a.get('owner', '') }}</td><td>{{ a.get('due_date', '') }}</td><td>{{ a.get('status', '') }}</td></tr>
+            {% endfor %}
+        </table>
+        {% else %}
+        <p>No actions defined</p>
+        {% endif %}
     </div>
 
     <div class="section">
         <div class="section-title">Success Metrics</div>
         <ul>
-            {success_metrics_html}
+            {% for m in success_metrics %}
+            <li>{{ m }}</li>
+            {% endfor %}
         </ul>
     </div>
 
     <div class="section">
         <div class="section-title">Timeline</div>
-        <div class="section-content">{timeline}</div>
+        <div class="section-content">{{ timeline }}</div>
     </div>
 </body>
 </html>
-'''
+''')
 
-    def generate_one_pager_html(self, one_pager) -> str:
+    def generate_one_pager_html(self, one_pager, persist: bool = True) -> str:
         """Generate HTML for a one-pager.
 
         Args:
             one_pager: OnePager model instance
+            persist: save the HTML onto the model when it changed
 
         Returns:
             HTML string
         """
-        e = html.escape
-        differentiators_html = '\n'.join([f'<li>{e(d)}</li>' for d in (one_pager.differentiators or [])])
-        next_steps_html = '\n'.join([f'<li>{e(s)}</li>' for s in (one_pager.next_steps or [])])
-
-        result_html = self.ONE_PAGER_TEMPLATE.format(
-            title=e(one_pager.title or ''),
-            headline=e(one_pager.headline or ''),
-            executive_summary=e(one_pager.executive_summary or ''),
-            challenge_section=e(one_pager.challenge_section or ''),
-            solution_section=e(one_pager.solution_section or ''),
-            benefits_section=e(one_pager.benefits_section or ''),
-            differentiators_html=differentiators_html,
-            call_to_action=e(one_pager.call_to_action or ''),
-            next_steps_html=next_steps_html,
-        )
-
-        # Save HTML to model
-        one_pager.html_content = result_html
-        one_pager.save(update_fields=['html_content'])
+        # One context dict passed positionally; render(**kwargs) would pack
+        # and then copy the same mapping a second time.
+        result_html = self.ONE_PAGER_TEMPLATE.render({
+            'title': one_pager.title or '',
+            'headline': one_pager.headline or '',
+            'executive_summary': one_pager.executive_summary or '',
+            'challenge_section': one_pager.challenge_section or '',
+            'solution_section': one_pager.solution_section or '',
+            'benefits_section': one_pager.benefits_section or '',
+            'differentiators': one_pager.differentiators or [],
+            'call_to_action': one_pager.call_to_action or '',
+            'next_steps': one_pager.next_steps or [],
+        })
+
+        # Save HTML to model, skipping the write when nothing changed
+        changed = one_pager.html_content != result_html
+        if persist and changed:
+            one_pager.html_content = result_html
+            one_pager.save(update_fields=['html_content'])
+
+        if persist:
+            path = asset_html_path(ONE_PAGER_HTML_DIR, one_pager.pk)
+            if path and (changed or not os.path.exists(path)):
+                _write_asset_html(path, result_html)
 
         return result_html
 
-    def generate_account_plan_html(self, account_plan) -> str:
+    def generate_account_plan_html(self, account_plan, persist: bool = True) -> str:
         """Generate HTML for an account plan.
 
         Args:
             account_plan: AccountPlan model instance
+            persist: save the HTML onto the model when it changed
 
         Returns:
             HTML string
         """
-        e = html.escape
-
-        # Strategic objectives
-        strategic_objectives_html = '\n'.join([f'<li>{e(o)}</li>' for o in (account_plan.strategic_objectives or [])])
-
-        # Stakeholders table
-        stakeholders = account_plan.key_stakeholders or []
-        stakeholders_rows = '\n'.join([
-            f"<tr><td>{e(s.get('name', ''))}</td><td>{e(s.get('title', ''))}</td><td>{e(s.get('role_in_decision', ''))}</td><td>{e(s.get('engagement_approach', ''))}</td></tr>"
-            for s in stakeholders
-        ])
-        stakeholders_table = f'''
-        <table>
-            <tr><th>Name</th><th>Title</th><th>Role</th><th>Engagement Approach</th></tr>
-            {stakeholders_rows}
-        </table>
-        ''' if stakeholders_rows else '<p>No stakeholders identified</p>'
-
-        # Opportunities table
-        opportunities = account_plan.opportunities or []
-        opportunities_rows = '\n'.join([
-            f"<tr><td>{e(o.get('name', ''))}</td><td>{e(o.get('value', ''))}</td><td>{e(o.get('timeline', ''))}</td><td>{e(o.get('probability', ''))}</td></tr>"
-            for o in opportunities
-        ])
-        opportunities_table = f'''
-        <table>
-            <tr><th>Opportunity</th><th>Value</th><th>Timeline</th><th>Probability</th></tr>
-            {opportunities_rows}
-        </table>
-        ''' if opportunities_rows else '<p>No opportunities identified</p>'
-
-        # SWOT
-        swot = account_plan.swot_analysis or {}
-        swot_strengths = '\n'.join([f'<li>{e(s)}</li>' for s in swot.get('strengths', [])])
-        swot_weaknesses = '\n'.join([f'<li>{e(w)}</li>' for w in swot.get('weaknesses', [])])
-        swot_opportunities = '\n'.join([f'<li>{e(o)}</li>' for o in swot.get('opportunities', [])])
-        swot_threats = '\n'.join([f'<li>{e(t)}</li>' for t in swot.get('threats', [])])
-
-        # Action plan table
-        actions = account_plan.action_plan or []
-        action_rows = '\n'.join([
-            f"<tr><td>{e(a.get('action', ''))}</td><td>{e(a.get('owner', ''))}</td><td>{e(a.get('due_date', ''))}</td><td>{e(a.get('status', ''))}</td></tr>"
-            for a in actions
-        ])
-        action_plan_table = f'''
-        <table>
-            <tr><th>Action</th><th>Owner</th><th>Due Date</th><th>Status</th></tr>
-            {action_rows}
-        </table>
-        ''' if action_rows else '<p>No actions defined</p>'
-
-        # Success metrics
-        success_metrics_html = '\n'.join([f'<li>{e(m)}</li>' for m in (account_plan.success_metrics or [])])
-
-        result_html = self.ACCOUNT_PLAN_TEMPLATE.format(
-            title=e(account_plan.title or ''),
-            executive_summary=e(account_plan.executive_summary or ''),
-            account_overview=e(account_plan.account_overview or ''),
-            strategic_objectives_html=strategic_objectives_html,
-            stakeholders_table=stakeholders_table,
-            opportunities_table=opportunities_table,
-            swot_strengths=swot_strengths,
-            swot_weaknesses=swot_weaknesses,
-            swot_opportunities=swot_opportunities,
-            swot_threats=swot_threats,
-            engagement_strategy=e(account_plan.engagement_strategy or ''),
-            action_plan_table=action_plan_table,
-            success_metrics_html=success_metrics_html,
-            timeline=e(account_plan.timeline or ''),
-        )
+        result_html = self.ACCOUNT_PLAN_TEMPLATE.render({
+            'title': account_plan.title or '',
+            'executive_summary': account_plan.executive_summary or '',
+            'account_overview': account_plan.account_overview or '',
+            'strategic_objectives': account_plan.strategic_objectives or [],
+            'key_stakeholders': account_plan.key_stakeholders or [],
+            'opportunities': account_plan.opportunities or [],
+            'swot': account_plan.swot_analysis or {},
+            'engagement_strategy': account_plan.engagement_strategy or '',
+            'action_plan': account_plan.action_plan or [],
+            'success_metrics': account_plan.success_metrics or [],
+            'timeline': account_plan.timeline or '',
+        })
 
         # Save HTML to model
-        account_plan.html_content = result_html
-        account_plan.save(update_fields=['html_content'])
+        changed = account_plan.html_content != result_html
+        if persist and changed:
+            account_plan.html_content = result_html
+            account_plan.save(update_fields=['html_content'])
+
+        if persist:
+            path = asset_html_path(ACCOUNT_PLAN_HTML_DIR, account_plan.pk)
+            if path and (changed or not os.path.exists(path)):
+                _write_asset_html(path, result_html)
 
         return result_html
 
@@ -312,14 +478,18 @@ class ExportService:
             Path to the generated PDF, or None if failed
         """
         try:
-            from weasyprint import HTML
-
-            # Ensure export directory exists
-            export_dir = os.path.join(settings.BASE_DIR, 'exports')
-            os.makedirs(export_dir, exist_ok=True)
-
-            output_path = os.path.join(export_dir, os.path.basename(output_filename))
-            HTML(string=html_content).write_pdf(output_path)
+            from weasyprint import HTML  # noqa: F401 -- fail fast when missing
+
+            output_path = str(_get_export_dir() / os.path.basename(output_filename))
+            if settings.EXPORT_PDF_WORKERS:
+                # Render in a worker process so the request thread's GIL is
+                # free while cairo/pango do their work.
+                future = _get_pdf_pool().submit(
+                    _render_pdf_blocking, html_content, output_path
+                )
+                future.result(timeout=settings.EXPORT_PDF_TIMEOUT)
+            else:
+                _render_pdf_blocking(html_content, output_path)
 
             logger.info(f"Generated PDF: {output_path}")
             return output_path
@@ -333,18 +503,18 @@ class ExportService:
 
     # ========== Research Report Export ==========
 
-    RESEARCH_REPORT_TEMPLATE = '''
+    RESEARCH_REPORT_TEMPLATE = _JINJA_ENV.from_string('''
 <!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
-    <title>{title}</title>
+    <title>{{ title }}</title>
     <style>
-        @page {{
+        @page {
             size: A4;
             margin: 2cm;
-        }}
-        body {{
+        }
+        body {
             font-family: 'Helvetica Neue', Arial, sans-serif;
             max-width: 900px;
             margin: 0 auto;
@@ -352,19 +522,19 @@ class ExportService:
             color: #333;
             font-size: 12px;
             line-height: 1.5;
-        }}
-        .header {{
+        }
+        .header {
             text-align: center;
             margin-bottom: 30px;
             border-bottom: 3px solid #0066cc;
             padding-bottom: 20px;
-        }}
-        .header h1 {{
+        }
+        .header h1 {
             color: #0066cc;
             margin-bottom: 10px;
             font-size: 28px;
-        }}
-        .header .vertical-badge {{
+        }
+        .header .vertical-badge {
             display: inline-block;
             background: #e3f2fd;
             color: #0066cc;
@@ -373,166 +543,166 @@ class ExportService:
             font-size: 11px;
             text-transform: capitalize;
             margin-bottom: 10px;
-        }}
-        .header .generated-date {{
+        }
+        .header .generated-date {
             color: #666;
             font-size: 11px;
-        }}
-        .page-break {{
+        }
+        .page-break {
             page-break-before: always;
-        }}
-        .section {{
+        }
+        .section {
             margin-bottom: 25px;
             page-break-inside: avoid;
-        }}
-        .section-title {{
+        }
+        .section-title {
             font-size: 16px;
             font-weight: bold;
             color: #0066cc;
             margin-bottom: 12px;
             border-bottom: 1px solid #ddd;
             padding-bottom: 5px;
-        }}
-        .subsection-title {{
+        }
+        .subsection-title {
             font-size: 13px;
             font-weight: bold;
             color: #333;
             margin-bottom: 8px;
             margin-top: 15px;
-        }}
-        .stats-grid {{
+        }
+        .stats-grid {
             display: flex;
             flex-wrap: wrap;
             gap: 10px;
             margin-bottom: 15px;
-        }}
-        .stat-card {{
+        }
+        .stat-card {
             background: #f5f5f5;
             padding: 10px 15px;
             border-radius: 5px;
             text-align: center;
             flex: 1;
             min-width: 100px;
-        }}
-        .stat-card .label {{
+        }
+        .stat-card .label {
             font-size: 10px;
             color: #666;
             text-transform: uppercase;
-        }}
-        .stat-card .value {{
+        }
+        .stat-card .value {
             font-weight: bold;
             color: #333;
             font-size: 14px;
-        }}
-        .card {{
+        }
+        .card {
             background: #f9f9f9;
             padding: 12px;
             border-radius: 5px;
             margin-bottom: 10px;
-        }}
-        .card-title {{
+        }
+        .card-title {
             font-weight: bold;
             color: #333;
-        }}
-        .card-subtitle {{
+        }
+        .card-subtitle {
             font-size: 11px;
             color: #666;
-        }}
-        .card-content {{
+        }
+        .card-content {
             margin-top: 5px;
             color: #444;
-        }}
-        table {{
+        }
+        table {
             width: 100%;
             border-collapse: collapse;
             margin-top: 10px;
             font-size: 11px;
-        }}
-        th, td {{
+        }
+        th, td {
             border: 1px solid #ddd;
             padding: 8px;
             text-align: left;
-        }}
-        th {{
+        }
+        th {
             background: #0066cc;
             color: white;
             font-weight: bold;
-        }}
-        tr:nth-child(even) {{
+        }
+        tr:nth-child(even) {
             background: #f9f9f9;
-        }}
-        ul {{
+        }
+        ul {
             margin: 0;
             padding-left: 20px;
-        }}
-        li {{
+        }
+        li {
             margin-bottom: 5px;
-        }}
-        .highlight-box {{
+        }
+        .highlight-box {
             background: #e3f2fd;
             border-left: 4px solid #0066cc;
             padding: 10px 15px;
             margin: 10px 0;
-        }}
-        .warning-box {{
+        }
+        .warning-box {
             background: #fff3e0;
             border-left: 4px solid #ff9800;
             padding: 10px 15px;
             margin: 10px 0;
-        }}
-        .success-box {{
+        }
+        .success-box {
             background: #e8f5e9;
             border-left: 4px solid #4caf50;
             padding: 10px 15px;
             margin: 10px 0;
-        }}
-        .gap-grid {{
+        }
+        .gap-grid {
             display: flex;
             gap: 15px;
             flex-wrap: wrap;
-        }}
-        .gap-column {{
+        }
+        .gap-column {
             flex: 1;
             min-width: 200px;
-        }}
-        .gap-item {{
+        }
+        .gap-item {
             padding: 8px;
             border-radius: 4px;
             margin-bottom: 8px;
             font-size: 11px;
-        }}
-        .gap-tech {{
+        }
+        .gap-tech {
             background: #ffebee;
             border-left: 3px solid #f44336;
-        }}
-        .gap-capability {{
+        }
+        .gap-capability {
             background: #fff3e0;
             border-left: 3px solid #ff9800;
-        }}
-        .gap-process {{
+        }
+        .gap-process {
             background: #f3e5f5;
             border-left: 3px solid #9c27b0;
-        }}
-        .confidence-badge {{
+        }
+        .confidence-badge {
             display: inline-block;
             padding: 3px 10px;
             border-radius: 10px;
             font-size: 11px;
             font-weight: bold;
-        }}
-        .confidence-high {{
+        }
+        .confidence-high {
             background: #e8f5e9;
             color: #2e7d32;
-        }}
-        .confidence-medium {{
+        }
+        .confidence-medium {
             background: #fff3e0;
             color: #f57c00;
-        }}
-        .confidence-low {{
+        }
+        .confidence-low {
             background: #ffebee;
             color: #c62828;
-        }}
-        .source-item {{
+        }
+        .source-item {
             padding: 8px 12px;
             background: #f5f5f5;
             border-radius: 5px;
@@ -540,8 +710,8 @@ class ExportService:
             display: flex;
             align-items: flex-start;
             gap: 10px;
-        }}
-        .source-number {{
+        }
+        .source-number {
             background: #0066cc;
             color: white;
             width: 24px;
@@ -553,20 +723,20 @@ class ExportService:
             font-size: 11px;
             font-weight: bold;
             flex-shrink: 0;
-        }}
-        .source-content {{
+        }
+        .source-content {
             flex: 1;
-        }}
-        .source-title {{
+        }
+        .source-title {
             font-weight: bold;
             color: #333;
-        }}
-        .source-url {{
+        }
+        .source-url {
             font-size: 10px;
             color: #0066cc;
             word-break: break-all;
-        }}
-        .raw-output {{
+        }
+        .raw-output {
             background: #f5f5f5;
             padding: 15px;
             border-radius: 5px;
@@ -576,66 +746,93 @@ class ExportService:
             word-break: break-word;
             max-height: none;
             overflow: visible;
-        }}
-        .footer {{
+        }
+        .footer {
             margin-top: 40px;
             padding-top: 15px;
             border-top: 1px solid #ddd;
             text-align: center;
             font-size: 10px;
             color: #666;
-        }}
-        .sentiment-badge {{
+        }
+        .sentiment-badge {
             display: inline-block;
             padding: 2px 8px;
             border-radius: 10px;
             font-size: 10px;
             text-transform: capitalize;
-        }}
-        .sentiment-positive {{
+        }
+        .sentiment-positive {
             background: #e8f5e9;
             color: #2e7d32;
-        }}
-        .sentiment-negative {{
+        }
+        .sentiment-negative {
             background: #ffebee;
             color: #c62828;
-        }}
-        .sentiment-neutral {{
+        }
+        .sentiment-neutral {
             background: #f5f5f5;
             color: #666;
-        }}
-        .sentiment-mixed {{
+        }
+        .sentiment-mixed {
             background: #fff3e0;
             color: #f57c00;
-        }}
-        .rating-bar {{
+        }
+        .rating-bar {
             display: flex;
             align-items: center;
             gap: 5px;
-        }}
-        .rating-bar-fill {{
+        }
+        .rating-bar-fill {
             height: 8px;
             background: #ddd;
             border-radius: 4px;
             flex: 1;
             overflow: hidden;
-        }}
-        .rating-bar-value {{
+        }
+        .rating-bar-value {
             height: 100%;
             background: #0066cc;
             border-radius: 4px;
-        }}
+        }
     </style>
 </head>
 <body>
-    {content}
+    <div class="header">
+        <h1>{{ client_name }}</h1>
+        {% if vertical %}<div class="vertical-badge">{{ vertical }}</div>{% endif %}
+        <div class="generated-date">Generated on {{ generated_day }}</div>
+    </div>
+
+    {{ content|safe }}
 
     <div class="footer">
-        Generated by Agent Researcher | {generated_date}
+        Generated by Agent Researcher | {{ generated_date }}
     </div>
 </body>
 </html>
-'''
+''')
+
+    @staticmethod
+    def fetch_for_report(pk):
+        """Fetch a ResearchJob with everything the report renderer reads.
+
+        Keeps the select_related/prefetch_related list next to the code
+        that depends on it, so callers get the single-query fetch without
+        each one re-listing the relations.
+
+        Raises:
+            ResearchJob.DoesNotExist: if no job matches pk
+        """
+        from research.models import ResearchJob
+
+        return ResearchJob.objects.select_related(
+            'report',
+            'gap_analysis',
+            'internal_ops',
+        ).prefetch_related(
+            'competitor_case_studies',
+        ).get(pk=pk)
 
     def generate_research_report_html(self, research_job) -> str:
         """Generate HTML for a complete research report.
@@ -646,6 +843,12 @@ class ExportService:
         Returns:
             HTML string
         """
+        # Serve the cached render when the job hasn't changed since
+        cache_path = self._report_cache_path(research_job)
+        if cache_path and os.path.exists(cache_path):
+            with open(cache_path, encoding='utf-8') as cached:
+                return cached.read()
+
         # Get related objects with graceful None handling
         report = getattr(research_job, 'report', None)
         gap_analysis = getattr(research_job, 'gap_analysis', None)
@@ -654,74 +857,92 @@ class ExportService:
         # Handle both prefetched and non-prefetched case studies
         case_studies = list(research_job.competitor_case_studies.all()) if hasattr(research_job, 'competitor_case_studies') else []
 
-        # Build content sections
-        sections = []
+        # Build content sections into one shared write buffer; fragments go
+        # straight into the StringIO with no intermediate list or join pass.
+        now = datetime.now()
+        buf = io.StringIO()
+        write = buf.write
 
-        # Header
-        header_html = self._build_header(research_job)
-        sections.append(header_html)
+        self._build_overview_section(write, research_job, report)
 
-        # Overview section
-        overview_html = self._build_overview_section(research_job, report)
-        sections.append(overview_html)
-
-        # Deep Research section (page break)
         if report:
-            deep_research_html = self._build_deep_research_section(report)
-            sections.append(f'<div class="page-break"></div>{deep_research_html}')
+            write('<div class="page-break"></div>')
+            self._build_deep_research_section(write, report)
 
-        # Competitors section (page break)
         if case_studies:
-            competitors_html = self._build_competitors_section(case_studies)
-            sections.append(f'<div class="page-break"></div>{competitors_html}')
+            write('<div class="page-break"></div>')
+            self._build_competitors_section(write, case_studies)
 
-        # Gap Analysis section (page break)
         if gap_analysis:
-            gaps_html = self._build_gap_analysis_section(gap_analysis)
-            sections.append(f'<div class="page-break"></div>{gaps_html}')
+            write('<div class="page-break"></div>')
+            self._build_gap_analysis_section(write, gap_analysis)
 
-        # Inside Intel section (page break)
         if internal_ops:
-            intel_html = self._build_inside_intel_section(internal_ops)
-            sections.append(f'<div class="page-break"></div>{intel_html}')
+            write('<div class="page-break"></div>')
+            self._build_inside_intel_section(write, internal_ops)
 
-        # Sources section (page break)
         if report and report.web_sources:
-            sources_html = self._build_sources_section(report.web_sources)
-            sections.append(f'<div class="page-break"></div>{sources_html}')
+            write('<div class="page-break"></div>')
+            self._build_sources_section(write, report.web_sources)
 
-        # Raw Output section (page break)
         if research_job.result:
-            raw_html = self._build_raw_output_section(research_job.result)
-            sections.append(f'<div class="page-break"></div>{raw_html}')
+            write('<div class="page-break"></div>')
+            self._build_raw_output_section(write, research_job.result)
 
-        # Combine all sections
-        content = '\n'.join(sections)
+        content = buf.getvalue()
 
-        return self.RESEARCH_REPORT_TEMPLATE.format(
+        result_html = self.RESEARCH_REPORT_TEMPLATE.render(
             title=f"Research Report: {research_job.client_name}",
+            client_name=research_job.client_name,
+            vertical=research_job.vertical.replace('_', ' ') if research_job.vertical else '',
             content=content,
-            generated_date=datetime.now().strftime('%B %d, %Y at %I:%M %p'),
+            generated_day=now.strftime('%B %d, %Y'),
+            generated_date=now.strftime('%B %d, %Y at %I:%M %p'),
         )
 
-    def _build_header(self, job) -> str:
-        """Build the report header."""
-        vertical_html = ''
-        if job.vertical:
-            vertical_display = job.vertical.replace('_', ' ')
-            vertical_html = f'<div class="vertical-badge">{html.escape(vertical_display)}</div>'
-
-        return f'''
-        <div class="header">
-            <h1>{html.escape(job.client_name)}</h1>
-            {vertical_html}
-            <div class="generated-date">Generated on {datetime.now().strftime('%B %d, %Y')}</div>
-        </div>
-        '''
+        if cache_path:
+            self._write_report_cache(cache_path, result_html, research_job.pk)
+
+        return result_html
 
-    def _build_overview_section(self, job, report) -> str:
-        """Build the Overview section."""
-        sections = ['<div class="section"><div class="section-title">Overview</div>']
+    @staticmethod
+    def _report_cache_path(research_job) -> Optional[str]:
+        """Cache file path for a job's rendered report, or None.
+
+        The filename embeds updated_at, so any change to the job naturally
+        invalidates the cached render.
+        """
+        updated_at = getattr(research_job, 'updated_at', None)
+        if getattr(research_job, 'pk', None) is None or updated_at is None:
+            return None
+        cache_dir = getattr(settings, 'EXPORT_CACHE_DIR', None)
+        if not cache_dir:
+            return None
+        return os.path.join(
+            cache_dir, f'rr_{research_job.pk}_{int(updated_at.timestamp())}.html'
+        )
+
+    @staticmethod
+    def _write_report_cache(cache_path, result_html, job_pk) -> None:
+        """Atomically write the rendered report and drop stale renders."""
+        cache_dir = os.path.dirname(cache_path)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = cache_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as tmp_file:
+                tmp_file.write(result_html)
+            os.replace(tmp_path, cache_path)
+            # Older renders of the same job are unreachable; reclaim them.
+            for stale in glob.glob(os.path.join(cache_dir, f'rr_{job_pk}_*.html')):
+                if stale != cache_path:
+                    os.remove(stale)
+        except OSError:
+            logger.warning("Could not write report cache %s", cache_path, exc_info=True)
+
+    def _build_overview_section(self, write, job, report) -> None:
+        """Write the Overview section into the buffer."""
+        esc = _escape
+        write('<div class="section"><div class="section-title">Overview</div>')
 
         # Stats grid
         if report:
@@ -729,31 +950,29 @@ class ExportService:
             if report.founded_year:
                 stats.append(f'<div class="stat-card"><div class="label">Founded</div><div class="value">{report.founded_year}</div></div>')
             if report.employee_count:
-                stats.append(f'<div class="stat-card"><div class="label">Employees</div><div class="value">{html.escape(report.employee_count)}</div></div>')
+                stats.append(f'<div class="stat-card"><div class="label">Employees</div><div class="value">{esc(report.employee_count)}</div></div>')
             if report.annual_revenue:
-                stats.append(f'<div class="stat-card"><div class="label">Revenue</div><div class="value">{html.escape(report.annual_revenue)}</div></div>')
+                stats.append(f'<div class="stat-card"><div class="label">Revenue</div><div class="value">{esc(report.annual_revenue)}</div></div>')
             if report.digital_maturity:
-                maturity_display = report.digital_maturity.replace('_', ' ').title()
-                stats.append(f'<div class="stat-card"><div class="label">Digital Maturity</div><div class="value">{html.escape(maturity_display)}</div></div>')
+                maturity_display = _display_label(report.digital_maturity)
+                stats.append(f'<div class="stat-card"><div class="label">Digital Maturity</div><div class="value">{esc(maturity_display)}</div></div>')
 
             if stats:
-                sections.append(f'<div class="stats-grid">{"".join(stats)}</div>')
+                write(f'<div class="stats-grid">{"".join(stats)}</div>')
 
             # Company Overview
             if report.company_overview:
-                sections.append(f'''
+                write(f'''
                 <div class="subsection-title">Company Overview</div>
-                <p>{html.escape(report.company_overview)}</p>
+                <p>{esc(report.company_overview)}</p>
                 ''')
 
             # Decision Makers
             if report.decision_makers:
-                sections.append('<div class="subsection-title">Key Decision Makers</div>')
+                write('<div class="subsection-title">Key Decision Makers</div>')
                 for dm in report.decision_makers:
-                    name = html.escape(dm.get('name') or '')
-                    title = html.escape(dm.get('title') or '')
-                    background = html.escape(dm.get('background') or '')
-                    sections.append(f'''
+                    name, title, background = _esc_row(dm, 'name', 'title', 'background')
+                    write(f'''
                     <div class="card">
                         <div class="card-title">{name}</div>
                         <div class="card-subtitle">{title}</div>
@@ -763,32 +982,32 @@ class ExportService:
 
             # Pain Points
             if report.pain_points:
-                sections.append('<div class="subsection-title">Pain Points</div><ul>')
+                write('<div class="subsection-title">Pain Points</div><ul>')
                 for point in report.pain_points:
-                    sections.append(f'<li style="color: #c62828;">{html.escape(point)}</li>')
-                sections.append('</ul>')
+                    write(f'<li style="color: #c62828;">{esc(point)}</li>')
+                write('</ul>')
 
             # Opportunities
             if report.opportunities:
-                sections.append('<div class="subsection-title">Opportunities</div><ul>')
+                write('<div class="subsection-title">Opportunities</div><ul>')
                 for opp in report.opportunities:
-                    sections.append(f'<li style="color: #2e7d32;">{html.escape(opp)}</li>')
-                sections.append('</ul>')
+                    write(f'<li style="color: #2e7d32;">{esc(opp)}</li>')
+                write('</ul>')
 
             # Talking Points
             if report.talking_points:
-                sections.append('<div class="subsection-title">Recommended Talking Points</div>')
+                write('<div class="subsection-title">Recommended Talking Points</div>')
                 for point in report.talking_points:
-                    sections.append(f'<div class="highlight-box">{html.escape(point)}</div>')
+                    write(f'<div class="highlight-box">{esc(point)}</div>')
         else:
-            sections.append('<p>Overview data not available.</p>')
+            write('<p>Overview data not available.</p>')
 
-        sections.append('</div>')
-        return '\n'.join(sections)
+        write('</div>')
 
-    def _build_deep_research_section(self, report) -> str:
-        """Build the Deep Research section."""
-        sections = ['<div class="section"><div class="section-title">Deep Research</div>']
+    def _build_deep_research_section(self, write, report) -> None:
+        """Write the Deep Research section into the buffer."""
+        esc = _escape
+        write('<div class="section"><div class="section-title">Deep Research</div>')
 
         # Company Details
         details = []
@@ -804,36 +1023,33 @@ class ExportService:
             details.append(('Revenue', report.annual_revenue))
 
         if details:
-            sections.append('<div class="subsection-title">Company Details</div>')
-            sections.append('<table><tr><th>Field</th><th>Value</th></tr>')
+            write('<div class="subsection-title">Company Details</div>')
+            write('<table><tr><th>Field</th><th>Value</th></tr>')
             for label, value in details:
-                sections.append(f'<tr><td>{html.escape(label)}</td><td>{html.escape(value)}</td></tr>')
-            sections.append('</table>')
+                write(f'<tr><td>{esc(label)}</td><td>{esc(value)}</td></tr>')
+            write('</table>')
 
         # AI Assessment
         if report.digital_maturity or report.ai_adoption_stage or report.ai_footprint:
-            sections.append('<div class="subsection-title">Digital & AI Assessment</div>')
+            write('<div class="subsection-title">Digital & AI Assessment</div>')
             assessment_items = []
             if report.digital_maturity:
-                maturity_display = report.digital_maturity.replace('_', ' ').title()
-                assessment_items.append(f'<div class="stat-card"><div class="label">Digital Maturity</div><div class="value">{html.escape(maturity_display)}</div></div>')
+                maturity_display = _display_label(report.digital_maturity)
+                assessment_items.append(f'<div class="stat-card"><div class="label">Digital Maturity</div><div class="value">{esc(maturity_display)}</div></div>')
             if report.ai_adoption_stage:
-                stage_display = report.ai_adoption_stage.replace('_', ' ').title()
-                assessment_items.append(f'<div class="stat-card"><div class="label">AI Adoption</div><div class="value">{html.escape(stage_display)}</div></div>')
+                stage_display = _display_label(report.ai_adoption_stage)
+                assessment_items.append(f'<div class="stat-card"><div class="label">AI Adoption</div><div class="value">{esc(stage_display)}</div></div>')
             if assessment_items:
-                sections.append(f'<div class="stats-grid">{"".join(assessment_items)}</div>')
+                write(f'<div class="stats-grid">{"".join(assessment_items)}</div>')
             if report.ai_footprint:
-                sections.append(f'<p>{html.escape(report.ai_footprint)}</p>')
+                write(f'<p>{esc(report.ai_footprint)}</p>')
 
         # Recent News
         if report.recent_news:
-            sections.append('<div class="subsection-title">Recent News</div>')
+            write('<div class="subsection-title">Recent News</div>')
             for news in report.recent_news[:5]:  # Limit to 5 items
-                title = html.escape(news.get('title') or '')
-                summary = html.escape(news.get('summary') or '')
-                date = html.escape(news.get('date') or '')
-                source = html.escape(news.get('source') or '')
-                sections.append(f'''
+                title, summary, date, source = _esc_row(news, 'title', 'summary', 'date', 'source')
+                write(f'''
                 <div class="card">
                     <div class="card-title">{title}</div>
                     <div class="card-content">{summary}</div>
@@ -843,165 +1059,131 @@ class ExportService:
 
         # Strategic Goals
         if report.strategic_goals:
-            sections.append('<div class="subsection-title">Strategic Goals</div><ol>')
+            write('<div class="subsection-title">Strategic Goals</div><ol>')
             for goal in report.strategic_goals:
-                sections.append(f'<li>{html.escape(goal)}</li>')
-            sections.append('</ol>')
+                write(f'<li>{esc(goal)}</li>')
+            write('</ol>')
 
         # Key Initiatives
         if report.key_initiatives:
-            sections.append('<div class="subsection-title">Key Initiatives</div>')
+            write('<div class="subsection-title">Key Initiatives</div>')
             for init in report.key_initiatives:
-                sections.append(f'<div class="highlight-box">{html.escape(init)}</div>')
-
-        sections.append('</div>')
-        return '\n'.join(sections)
-
-    def _build_competitors_section(self, case_studies) -> str:
-        """Build the Competitors section."""
-        sections = ['<div class="section"><div class="section-title">Competitor Case Studies</div>']
-        sections.append(f'<p>Found {len(case_studies)} relevant competitor case studies:</p>')
+                write(f'<div class="highlight-box">{esc(init)}</div>')
 
-        sections.append('''
-        <table>
-            <tr>
-                <th>Competitor</th>
-                <th>Case Study</th>
-                <th>Technologies</th>
-                <th>Match</th>
-            </tr>
-        ''')
-
-        for cs in case_studies:
-            competitor_name = html.escape(cs.competitor_name)
-            case_title = html.escape(cs.case_study_title)
-            summary = html.escape(cs.summary[:200] + '...' if len(cs.summary) > 200 else cs.summary)
-            technologies = ', '.join(cs.technologies_used[:3]) if cs.technologies_used else '-'
-            match_pct = f"{round(cs.relevance_score * 100)}%"
-
-            sections.append(f'''
-            <tr>
-                <td><strong>{competitor_name}</strong></td>
-                <td>{case_title}<br><small style="color: #666;">{summary}</small></td>
-                <td>{html.escape(technologies)}</td>
-                <td style="text-align: center;"><strong>{match_pct}</strong></td>
-            </tr>
-            ''')
+        write('</div>')
 
-        sections.append('</table>')
+    def _build_competitors_section(self, write, case_studies) -> None:
+        """Write the Competitors section into the buffer."""
+        if not case_studies:
+            return
+        write(_COMPETITORS_TEMPLATE.render(case_studies=case_studies))
 
-        # Outcomes for top case studies
-        for cs in case_studies[:3]:
-            if cs.outcomes:
-                sections.append(f'<div class="subsection-title">{html.escape(cs.competitor_name)} - Key Outcomes</div>')
-                sections.append('<ul>')
-                for outcome in cs.outcomes:
-                    sections.append(f'<li style="color: #2e7d32;">{html.escape(outcome)}</li>')
-                sections.append('</ul>')
-
-        sections.append('</div>')
-        return '\n'.join(sections)
-
-    def _build_gap_analysis_section(self, gap_analysis) -> str:
-        """Build the Gap Analysis section."""
-        sections = ['<div class="section"><div class="section-title">Gap Analysis</div>']
+    def _build_gap_analysis_section(self, write, gap_analysis) -> None:
+        """Write the Gap Analysis section into the buffer."""
+        esc = _escape
+        write('<div class="section"><div class="section-title">Gap Analysis</div>')
 
         # Confidence score
-        confidence_pct = round(gap_analysis.confidence_score * 100)
-        confidence_class = 'confidence-high' if confidence_pct >= 70 else ('confidence-medium' if confidence_pct >= 40 else 'confidence-low')
-        sections.append(f'''
+        confidence_pct, confidence_class = _confidence_badge(gap_analysis.confidence_score)
+        write(f'''
         <p>Analysis Confidence: <span class="confidence-badge {confidence_class}">{confidence_pct}%</span></p>
         ''')
 
         # Priority Areas
         if gap_analysis.priority_areas:
-            sections.append('<div class="subsection-title">Priority Areas</div>')
+            write('<div class="subsection-title">Priority Areas</div>')
             for i, area in enumerate(gap_analysis.priority_areas, 1):
-                sections.append(f'<div class="warning-box"><strong>#{i}</strong> {html.escape(area)}</div>')
-
-        # Gap Grid
-        has_gaps = gap_analysis.technology_gaps or gap_analysis.capability_gaps or gap_analysis.process_gaps
-        if has_gaps:
-            sections.append('<div class="subsection-title">Identified Gaps</div><div class="gap-grid">')
-
-            if gap_analysis.technology_gaps:
-                sections.append('<div class="gap-column"><strong>Technology Gaps</strong>')
-                for gap in gap_analysis.technology_gaps:
-                    sections.append(f'<div class="gap-item gap-tech">{html.escape(gap)}</div>')
-                sections.append('</div>')
-
-            if gap_analysis.capability_gaps:
-                sections.append('<div class="gap-column"><strong>Capability Gaps</strong>')
-                for gap in gap_analysis.capability_gaps:
-                    sections.append(f'<div class="gap-item gap-capability">{html.escape(gap)}</div>')
-                sections.append('</div>')
+                write(f'<div class="warning-box"><strong>#{i}</strong> {esc(area)}</div>')
+
+        # Gap Grid: the three columns share one loop body instead of three
+        # copies of the same control flow.
+        gap_columns = (
+            ('Technology Gaps', 'gap-tech', gap_analysis.technology_gaps),
+            ('Capability Gaps', 'gap-capability', gap_analysis.capability_gaps),
+            ('Process Gaps', 'gap-process', gap_analysis.process_gaps),
+        )
+        if any(items for _, _, items in gap_columns):
+            write('<div class="subsection-title">Identified Gaps</div><div class="gap-grid">')
 
-            if gap_analysis.process_gaps:
-                sections.append('<div class="gap-column"><strong>Process Gaps</strong>')
-                for gap in gap_analysis.process_gaps:
-                    sections.append(f'<div class="gap-item gap-process">{html.escape(gap)}</div>')
-                sections.append('</div>')
+            for column_title, css_class, items in gap_columns:
+                if not items:
+                    continue
+                write(f'<div class="gap-column"><strong>{column_title}</strong>')
+                for gap in items:
+                    write(f'<div class="gap-item {css_class}">{esc(gap)}</div>')
+                write('</div>')
 
-            sections.append('</div>')
+            write('</div>')
 
         # Recommendations
         if gap_analysis.recommendations:
-            sections.append('<div class="subsection-title">Recommendations</div>')
+            write('<div class="subsection-title">Recommendations</div>')
             for rec in gap_analysis.recommendations:
-                sections.append(f'<div class="success-box">{html.escape(rec)}</div>')
+                write(f'<div class="success-box">{esc(rec)}</div>')
 
         # Analysis Notes
         if gap_analysis.analysis_notes:
-            sections.append(f'<div class="subsection-title">Analysis Notes</div><p>{html.escape(gap_analysis.analysis_notes)}</p>')
-
-        sections.append('</div>')
-        return '\n'.join(sections)
-
-    def _build_inside_intel_section(self, intel) -> str:
-        """Build the Inside Intel section."""
-        sections = ['<div class="section"><div class="section-title">Inside Intel</div>']
+            write(f'<div class="subsection-title">Analysis Notes</div><p>{esc(gap_analysis.analysis_notes)}</p>')
+
+        write('</div>')
+
+    # Sentiment category keys with their display labels precomputed, so the
+    # per-export cost is a dict get instead of replace + title per category.
+    _CATEGORY_LABELS = (
+        ('work_life_balance', 'Work Life Balance'),
+        ('compensation', 'Compensation'),
+        ('culture', 'Culture'),
+        ('management', 'Management'),
+    )
+
+    def _build_inside_intel_section(self, write, intel) -> None:
+        """Write the Inside Intel section into the buffer."""
+        if not (intel.employee_sentiment or intel.job_postings
+                or intel.linkedin_presence or intel.key_insights
+                or intel.gap_correlations):
+            return
+        esc = _escape
+        write('<div class="section"><div class="section-title">Inside Intel</div>')
 
         # Employee Sentiment
         if intel.employee_sentiment:
             sentiment = intel.employee_sentiment
-            sections.append('<div class="subsection-title">Employee Sentiment</div>')
+            write('<div class="subsection-title">Employee Sentiment</div>')
 
             # Overall rating
             overall = sentiment.get('overall_rating', 0)
-            sections.append(f'''
+            write(f'''
             <div class="stats-grid">
                 <div class="stat-card"><div class="label">Overall Rating</div><div class="value">{overall:.1f}/5.0</div></div>
                 <div class="stat-card"><div class="label">Would Recommend</div><div class="value">{sentiment.get("recommend_pct", 0)}%</div></div>
-                <div class="stat-card"><div class="label">Trend</div><div class="value" style="text-transform: capitalize;">{sentiment.get("trend", "stable")}</div></div>
+                <div class="stat-card"><div class="label">Trend</div><div class="value" style="text-transform: capitalize;">{esc(sentiment.get("trend") or "stable")}</div></div>
             </div>
             ''')
 
             # Category ratings
-            categories = ['work_life_balance', 'compensation', 'culture', 'management']
             category_ratings = []
-            for cat in categories:
-                val = sentiment.get(cat, 0)
+            for key, label in self._CATEGORY_LABELS:
+                val = sentiment.get(key, 0)
                 if val:
-                    label = cat.replace('_', ' ').title()
                     category_ratings.append(f'<div class="stat-card"><div class="label">{label}</div><div class="value">{val:.1f}</div></div>')
             if category_ratings:
-                sections.append(f'<div class="stats-grid">{"".join(category_ratings)}</div>')
+                write(f'<div class="stats-grid">{"".join(category_ratings)}</div>')
 
             # Themes
             positive_themes = sentiment.get('positive_themes', [])
             negative_themes = sentiment.get('negative_themes', [])
             if positive_themes:
-                themes_html = ', '.join(html.escape(t) for t in positive_themes)
-                sections.append(f'<p><strong>Positive Themes:</strong> {themes_html}</p>')
+                themes_html = ', '.join(_esc_cached(t) for t in positive_themes)
+                write(f'<p><strong>Positive Themes:</strong> {themes_html}</p>')
             if negative_themes:
-                themes_html = ', '.join(html.escape(t) for t in negative_themes)
-                sections.append(f'<p><strong>Negative Themes:</strong> {themes_html}</p>')
+                themes_html = ', '.join(_esc_cached(t) for t in negative_themes)
+                write(f'<p><strong>Negative Themes:</strong> {themes_html}</p>')
 
         # Job Postings / Hiring
         if intel.job_postings:
             jobs = intel.job_postings
-            sections.append('<div class="subsection-title">Hiring Intelligence</div>')
-            sections.append(f'''
+            write('<div class="subsection-title">Hiring Intelligence</div>')
+            write(f'''
             <div class="stats-grid">
                 <div class="stat-card"><div class="label">Total Open Positions</div><div class="value">{jobs.get("total_openings", 0)}</div></div>
             </div>
@@ -1010,59 +1192,59 @@ class ExportService:
             # Departments hiring
             depts = jobs.get('departments_hiring', {})
             if depts:
-                sections.append('<p><strong>Departments Hiring:</strong></p><ul>')
-                for dept, count in sorted(depts.items(), key=lambda x: x[1], reverse=True)[:5]:
-                    sections.append(f'<li>{html.escape(dept)}: {count} positions</li>')
-                sections.append('</ul>')
+                write('<p><strong>Departments Hiring:</strong></p><ul>')
+                for dept, count in heapq.nlargest(5, depts.items(), key=itemgetter(1)):
+                    write(f'<li>{_esc_cached(dept)}: {count} positions</li>')
+                write('</ul>')
 
             # Skills sought
             skills = jobs.get('skills_sought', [])
             if skills:
-                skills_html = ', '.join(html.escape(s) for s in skills[:10])
-                sections.append(f'<p><strong>Key Skills Sought:</strong> {skills_html}</p>')
+                skills_html = ', '.join(_esc_cached(s) for s in skills[:10])
+                write(f'<p><strong>Key Skills Sought:</strong> {skills_html}</p>')
 
             # Urgency signals
             urgency = jobs.get('urgency_signals', [])
             if urgency:
-                sections.append('<p><strong>Urgency Signals:</strong></p>')
+                write('<p><strong>Urgency Signals:</strong></p>')
                 for signal in urgency:
-                    sections.append(f'<div class="warning-box">{html.escape(signal)}</div>')
+                    write(f'<div class="warning-box">{esc(signal)}</div>')
 
             # Insights
             insights = jobs.get('insights', '')
             if insights:
-                sections.append(f'<div class="highlight-box">{html.escape(insights)}</div>')
+                write(f'<div class="highlight-box">{esc(insights)}</div>')
 
         # LinkedIn Presence
         if intel.linkedin_presence:
             linkedin = intel.linkedin_presence
-            sections.append('<div class="subsection-title">LinkedIn Presence</div>')
-            sections.append(f'''
+            write('<div class="subsection-title">LinkedIn Presence</div>')
+            write(f'''
             <div class="stats-grid">
                 <div class="stat-card"><div class="label">Followers</div><div class="value">{linkedin.get("follower_count", 0):,}</div></div>
-                <div class="stat-card"><div class="label">Engagement</div><div class="value" style="text-transform: capitalize;">{linkedin.get("engagement_level", "n/a")}</div></div>
-                <div class="stat-card"><div class="label">Employee Trend</div><div class="value" style="text-transform: capitalize;">{linkedin.get("employee_trend", "stable")}</div></div>
+                <div class="stat-card"><div class="label">Engagement</div><div class="value" style="text-transform: capitalize;">{esc(linkedin.get("engagement_level") or "n/a")}</div></div>
+                <div class="stat-card"><div class="label">Employee Trend</div><div class="value" style="text-transform: capitalize;">{esc(linkedin.get("employee_trend") or "stable")}</div></div>
             </div>
             ''')
 
             # Notable changes
             changes = linkedin.get('notable_changes', [])
             if changes:
-                sections.append('<p><strong>Notable Changes:</strong></p><ul>')
+                write('<p><strong>Notable Changes:</strong></p><ul>')
                 for change in changes:
-                    sections.append(f'<li>{html.escape(change)}</li>')
-                sections.append('</ul>')
+                    write(f'<li>{esc(change)}</li>')
+                write('</ul>')
 
         # Key Insights
         if intel.key_insights:
-            sections.append('<div class="subsection-title">Key Insights & Recommendations</div>')
+            write('<div class="subsection-title">Key Insights & Recommendations</div>')
             for insight in intel.key_insights:
-                sections.append(f'<div class="warning-box">{html.escape(insight)}</div>')
+                write(f'<div class="warning-box">{esc(insight)}</div>')
 
         # Gap Correlations
         if intel.gap_correlations:
-            sections.append('<div class="subsection-title">Gap Correlation Insights</div>')
-            sections.append('''
+            write('<div class="subsection-title">Gap Correlation Insights</div>')
+            write('''
             <table>
                 <tr>
                     <th>Gap Type</th>
@@ -1072,11 +1254,10 @@ class ExportService:
                 </tr>
             ''')
             for corr in intel.gap_correlations:
-                gap_type = html.escape((corr.get('gap_type') or '').title())
-                desc = html.escape(corr.get('description') or '')
-                evidence = html.escape(corr.get('evidence') or '')
+                gap_type = esc((corr.get('gap_type') or '').title())
+                desc, evidence = _esc_row(corr, 'description', 'evidence')
                 confidence = f"{round(corr.get('confidence', 0) * 100)}%"
-                sections.append(f'''
+                write(f'''
                 <tr>
                     <td><strong>{gap_type}</strong></td>
                     <td>{desc}</td>
@@ -1084,49 +1265,63 @@ class ExportService:
                     <td style="text-align: center;">{confidence}</td>
                 </tr>
                 ''')
-            sections.append('</table>')
+            write('</table>')
 
         # Confidence footer
-        confidence_pct = round(intel.confidence_score * 100)
-        confidence_class = 'confidence-high' if confidence_pct >= 70 else ('confidence-medium' if confidence_pct >= 40 else 'confidence-low')
+        confidence_pct, confidence_class = _confidence_badge(intel.confidence_score)
         freshness = intel.data_freshness.replace('_', ' ') if intel.data_freshness else 'unknown'
-        sections.append(f'''
+        write(f'''
         <p style="margin-top: 15px;">
             Confidence: <span class="confidence-badge {confidence_class}">{confidence_pct}%</span>
-            &nbsp;&nbsp;|&nbsp;&nbsp;Data Freshness: {html.escape(freshness)}
+            &nbsp;&nbsp;|&nbsp;&nbsp;Data Freshness: {esc(freshness)}
         </p>
         ''')
 
-        sections.append('</div>')
-        return '\n'.join(sections)
-
-    def _build_sources_section(self, sources) -> str:
-        """Build the Sources section."""
-        sections = ['<div class="section"><div class="section-title">Sources</div>']
-        sections.append(f'<p>Research grounded with {len(sources)} web source{"s" if len(sources) != 1 else ""}:</p>')
+        write('</div>')
 
-        for i, source in enumerate(sources, 1):
-            title = html.escape(source.get('title') or 'Untitled Source')
-            uri = source.get('uri') or ''
-            uri_display = html.escape(uri) if uri else ''
-
-            sections.append(f'''
+    # Per-row source markup, pre-split by URL presence so the loop body is a
+    # single format_map call with no conditional sub-expression.
+    _SRC_ROW_WITH_URL = '''
             <div class="source-item">
                 <div class="source-number">{i}</div>
                 <div class="source-content">
                     <div class="source-title">{title}</div>
-                    {f'<div class="source-url">{uri_display}</div>' if uri_display else ''}
+                    <div class="source-url">{uri}</div>
                 </div>
             </div>
-            ''')
-
-        sections.append('<p style="font-size: 10px; color: #666; margin-top: 15px;">Sources collected via Google Search grounding for real-time, verified information.</p>')
-        sections.append('</div>')
-        return '\n'.join(sections)
+            '''
+    _SRC_ROW_NO_URL = '''
+            <div class="source-item">
+                <div class="source-number">{i}</div>
+                <div class="source-content">
+                    <div class="source-title">{title}</div>
+                </div>
+            </div>
+            '''
+
+    def _build_sources_section(self, write, sources) -> None:
+        """Write the Sources section into the buffer."""
+        if not sources:
+            return
+        esc = _escape
+        row_with_url = self._SRC_ROW_WITH_URL.format_map
+        row_no_url = self._SRC_ROW_NO_URL.format_map
+        write('<div class="section"><div class="section-title">Sources</div>')
+        write(f'<p>Research grounded with {len(sources)} web source{"s" if len(sources) != 1 else ""}:</p>')
 
-    def _build_raw_output_section(self, result) -> str:
-        """Build the Raw Output section with full content."""
-        sections = ['<div class="section"><div class="section-title">Raw Output</div>']
-        sections.append(f'<div class="raw-output">{html.escape(result)}</div>')
-        sections.append('</div>')
-        return '\n'.join(sections)
+        for i, source in enumerate(sources, 1):
+            title = esc(source.get('title') or 'Untitled Source')
+            uri = source.get('uri') or ''
+            if uri:
+                write(row_with_url({'i': i, 'title': title, 'uri': esc(uri)}))
+            else:
+                write(row_no_url({'i': i, 'title': title}))
+
+        write('<p style="font-size: 10px; color: #666; margin-top: 15px;">Sources collected via Google Search grounding for real-time, verified information.</p>')
+        write('</div>')
+
+    def _build_raw_output_section(self, write, result) -> None:
+        """Write the Raw Output section into the buffer with full content."""
+        write('<div class="section"><div class="section-title">Raw Output</div>')
+        write(f'<div class="raw-output">{_escape(result)}</div>')
+        write('</div>')
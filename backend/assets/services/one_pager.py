@@ -4,10 +4,17 @@ import logging
 from dataclasses import dataclass, field
 from typing import List
 
+import orjson
+
+from research.services.gemini import GeminiClient
+
+from ..models import OnePager
+from .context import build_research_context
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class OnePagerData:
     """Data structure for a one-pager document."""
     title: str = ""
@@ -24,21 +31,15 @@ class OnePagerData:
 class OnePagerGenerator:
     """Service to generate one-pager sales documents."""
 
-    ONE_PAGER_PROMPT = '''You are a sales content expert creating a one-page sales document.
-
-Based on the following:
-- Company: {client_name}
-- Industry: {vertical}
-- Pain Points: {pain_points}
-- Opportunities: {opportunities}
-- Use Case: {use_case_title}
-- Solution: {proposed_solution}
-- Benefits: {expected_benefits}
+    # Static instructions come first so the block can be registered as a
+    # Gemini cached_content prefix; only the research context below is
+    # sent (and billed) per call.
+    ONE_PAGER_PROMPT_STATIC = '''You are a sales content expert creating a one-page sales document.
 
-Create a compelling one-pager sales document.
+Create a compelling one-pager sales document for the company described in the research context at the end of this prompt.
 
 Respond with valid JSON:
-{{
+{
     "title": "Document title",
     "headline": "Compelling headline that captures the value proposition",
     "executive_summary": "2-3 sentence executive summary",
@@ -48,7 +49,7 @@ Respond with valid JSON:
     "differentiators": ["Differentiator 1", "Differentiator 2", "Differentiator 3"],
     "call_to_action": "Clear call to action",
     "next_steps": ["Step 1", "Step 2", "Step 3"]
-}}
+}
 
 IMPORTANT:
 - Keep content concise but compelling
@@ -65,44 +66,62 @@ IMPORTANT:
     def gemini_client(self):
         """Lazy initialization of Gemini client."""
         if self._gemini_client is None:
-            from research.services.gemini import GeminiClient
             self._gemini_client = GeminiClient()
         return self._gemini_client
 
-    def generate_one_pager(self, research_job, use_case=None) -> OnePagerData:
-        """Generate a one-pager from research and optional use case.
+    def build_prompt(self, research_job, use_case=None) -> str:
+        """Build the full one-pager prompt without calling the LLM.
 
         Args:
             research_job: ResearchJob model instance
             use_case: Optional UseCase model instance
 
         Returns:
-            OnePagerData object
+            Formatted prompt string
         """
-        report = getattr(research_job, 'report', None)
+        return self.ONE_PAGER_PROMPT_STATIC + self._build_context(research_job, use_case)
 
-        context = {
-            'client_name': research_job.client_name,
-            'vertical': research_job.vertical or 'unknown',
-            'pain_points': ', '.join(report.pain_points[:5]) if report and report.pain_points else 'Not identified',
-            'opportunities': ', '.join(report.opportunities[:3]) if report and report.opportunities else 'Not identified',
-            'use_case_title': use_case.title if use_case else 'General AI/Technology Solution',
-            'proposed_solution': use_case.proposed_solution if use_case else 'AI-powered solutions',
-            'expected_benefits': ', '.join(use_case.expected_benefits) if use_case and use_case.expected_benefits else 'Improved efficiency and outcomes',
-        }
+    def _build_context(self, research_job, use_case=None) -> str:
+        """Build the per-job research context block of the prompt.
 
-        prompt = self.ONE_PAGER_PROMPT.format(**context)
+        Assembled directly as an f-string rather than running the
+        template through str.format, which re-parses the format spec and
+        does a dict lookup per placeholder on every call.
+        """
+        ctx = build_research_context(research_job)
+
+        expected_benefits = ', '.join(use_case.expected_benefits) if use_case and use_case.expected_benefits else 'Improved efficiency and outcomes'
+
+        return (
+            f"\nResearch context:\n"
+            f"- Company: {ctx['client_name']}\n"
+            f"- Industry: {ctx['vertical']}\n"
+            f"- Pain Points: {ctx['pain_points']}\n"
+            f"- Opportunities: {ctx['opportunities']}\n"
+            f"- Use Case: {use_case.title if use_case else 'General AI/Technology Solution'}\n"
+            f"- Solution: {use_case.proposed_solution if use_case else 'AI-powered solutions'}\n"
+            f"- Benefits: {expected_benefits}\n"
+        )
 
-        try:
-            response = self.gemini_client.generate_text(prompt)
+    def parse_one_pager(self, response: str, research_job) -> OnePagerData:
+        """Parse an LLM response into OnePagerData; default-titled on bad output.
 
-            # Parse JSON response
-            response_text = response.strip()
-            if response_text.startswith('```'):
-                lines = response_text.split('\n')
-                response_text = '\n'.join(lines[1:-1])
+        Args:
+            response: Raw response text from the LLM
+            research_job: ResearchJob used for the fallback title
 
-            data = json.loads(response_text)
+        Returns:
+            OnePagerData object
+        """
+        try:
+            # Slice the JSON object out of the response (skipping code
+            # fences or other surrounding text) and hand it to orjson's
+            # C parser, as the account-plan service already does.
+            start = response.find('{')
+            end = response.rfind('}')
+            if start < 0 or end <= start:
+                raise json.JSONDecodeError('No JSON object in response', response, 0)
+            data = orjson.loads(response[start:end + 1])
 
             return OnePagerData(
                 title=data.get('title', ''),
@@ -119,10 +138,34 @@ IMPORTANT:
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse one-pager response: {e}")
             return OnePagerData(title=f"One-Pager for {research_job.client_name}")
+        except Exception as e:
+            logger.exception("Error parsing one-pager response")
+            return OnePagerData(title=f"One-Pager for {research_job.client_name}")
+
+    def generate_one_pager(self, research_job, use_case=None, cache: bool = True) -> OnePagerData:
+        """Generate a one-pager from research and optional use case.
+
+        Args:
+            research_job: ResearchJob model instance
+            use_case: Optional UseCase model instance
+            cache: Whether to use the semantic response cache, so
+                regenerations for unchanged research skip the LLM call
+
+        Returns:
+            OnePagerData object
+        """
+        context_block = self._build_context(research_job, use_case)
+
+        try:
+            response = self.gemini_client.generate_text_cached_prefix(
+                self.ONE_PAGER_PROMPT_STATIC, context_block, cache=cache
+            )
         except Exception as e:
             logger.exception("Error during one-pager generation")
             return OnePagerData(title=f"One-Pager for {research_job.client_name}")
 
+        return self.parse_one_pager(response, research_job)
+
     def create_one_pager_model(self, research_job, one_pager_data: OnePagerData):
         """Create OnePager model instance.
 
@@ -133,8 +176,6 @@ IMPORTANT:
         Returns:
             Created OnePager instance
         """
-        from ..models import OnePager
-
         one_pager = OnePager.objects.create(
             research_job=research_job,
             title=one_pager_data.title,
@@ -4,10 +4,17 @@ import logging
 from typing import List
 from dataclasses import dataclass, field
 
+import orjson
+
+from research.services.gemini import GeminiClient
+
+from ..models import Persona
+from .context import build_research_context
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class PersonaData:
     """Data structure for a buyer persona."""
     name: str = ""
@@ -28,22 +35,17 @@ class PersonaData:
 class PersonaGenerator:
     """Service to generate buyer personas from research."""
 
-    PERSONA_PROMPT = '''You are a sales strategy expert creating buyer personas.
+    # Static instructions come first so the block can be registered as a
+    # Gemini cached_content prefix; only the research context below is
+    # sent (and billed) per call.
+    PERSONA_PROMPT_STATIC = '''You are a sales strategy expert creating buyer personas.
 
-Based on the following research:
-- Company: {client_name}
-- Industry: {vertical}
-- Decision Makers: {decision_makers}
-- Pain Points: {pain_points}
-- Strategic Goals: {strategic_goals}
-- Digital Maturity: {digital_maturity}
-
-Generate 2-3 detailed buyer personas for key stakeholders at this company.
+Generate 2-3 detailed buyer personas for key stakeholders at the company described in the research context at the end of this prompt.
 
 Respond with valid JSON:
-{{
+{
     "personas": [
-        {{
+        {
             "name": "Persona name (e.g., 'The Tech-Forward CTO')",
             "title": "Job title",
             "department": "Department",
@@ -57,9 +59,9 @@ Respond with valid JSON:
             "objections": ["Common objection 1", "Common objection 2"],
             "content_preferences": ["Whitepapers", "Case studies", "Demos"],
             "key_messages": ["Message that resonates 1", "Message 2"]
-        }}
+        }
     ]
-}}
+}
 
 IMPORTANT:
 - Create 2-3 distinct personas
@@ -76,53 +78,57 @@ IMPORTANT:
     def gemini_client(self):
         """Lazy initialization of Gemini client."""
         if self._gemini_client is None:
-            from research.services.gemini import GeminiClient
             self._gemini_client = GeminiClient()
         return self._gemini_client
 
-    def generate_personas(self, research_job) -> List[PersonaData]:
-        """Generate personas from a completed research job.
+    def build_prompt(self, research_job) -> str:
+        """Build the full persona prompt without calling the LLM.
 
         Args:
             research_job: ResearchJob model instance
 
         Returns:
-            List of PersonaData objects
+            Formatted prompt string
         """
-        report = getattr(research_job, 'report', None)
-
-        # Format decision makers
-        decision_makers = "Not identified"
-        if report and report.decision_makers:
-            dms = []
-            for dm in report.decision_makers[:5]:
-                if isinstance(dm, dict):
-                    dms.append(f"{dm.get('name', '')} ({dm.get('title', '')})")
-                else:
-                    dms.append(str(dm))
-            decision_makers = ', '.join(dms)
-
-        context = {
-            'client_name': research_job.client_name,
-            'vertical': research_job.vertical or 'unknown',
-            'decision_makers': decision_makers,
-            'pain_points': ', '.join(report.pain_points[:5]) if report and report.pain_points else 'Not identified',
-            'strategic_goals': ', '.join(report.strategic_goals[:5]) if report and report.strategic_goals else 'Not identified',
-            'digital_maturity': report.digital_maturity if report else 'unknown',
-        }
+        return self.PERSONA_PROMPT_STATIC + self._build_context(research_job)
 
-        prompt = self.PERSONA_PROMPT.format(**context)
+    def _build_context(self, research_job) -> str:
+        """Build the per-job research context block of the prompt.
 
-        try:
-            response = self.gemini_client.generate_text(prompt)
+        Assembled directly as an f-string rather than running the
+        template through str.format, which re-parses the format spec and
+        does a dict lookup per placeholder on every call.
+        """
+        ctx = build_research_context(research_job)
+
+        return (
+            f"\nResearch context:\n"
+            f"- Company: {ctx['client_name']}\n"
+            f"- Industry: {ctx['vertical']}\n"
+            f"- Decision Makers: {ctx['decision_makers']}\n"
+            f"- Pain Points: {ctx['pain_points']}\n"
+            f"- Strategic Goals: {ctx['strategic_goals']}\n"
+            f"- Digital Maturity: {ctx['digital_maturity']}\n"
+        )
 
-            # Parse JSON response
-            response_text = response.strip()
-            if response_text.startswith('```'):
-                lines = response_text.split('\n')
-                response_text = '\n'.join(lines[1:-1])
+    def parse_personas(self, response: str) -> List[PersonaData]:
+        """Parse an LLM response into PersonaData objects; [] on bad output.
+
+        Args:
+            response: Raw response text from the LLM
 
-            data = json.loads(response_text)
+        Returns:
+            List of PersonaData objects
+        """
+        try:
+            # Slice the JSON object out of the response (skipping code
+            # fences or other surrounding text) and hand it to orjson's
+            # C parser, as the account-plan service already does.
+            start = response.find('{')
+            end = response.rfind('}')
+            if start < 0 or end <= start:
+                raise json.JSONDecodeError('No JSON object in response', response, 0)
+            data = orjson.loads(response[start:end + 1])
             personas = []
 
             for p in data.get('personas', []):
@@ -147,10 +153,33 @@ IMPORTANT:
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse persona response: {e}")
             return []
+        except Exception as e:
+            logger.exception("Error parsing persona response")
+            return []
+
+    def generate_personas(self, research_job, cache: bool = True) -> List[PersonaData]:
+        """Generate personas from a completed research job.
+
+        Args:
+            research_job: ResearchJob model instance
+            cache: Whether to use the semantic response cache, so
+                regenerations for unchanged research skip the LLM call
+
+        Returns:
+            List of PersonaData objects
+        """
+        context_block = self._build_context(research_job)
+
+        try:
+            response = self.gemini_client.generate_text_cached_prefix(
+                self.PERSONA_PROMPT_STATIC, context_block, cache=cache
+            )
         except Exception as e:
             logger.exception("Error during persona generation")
             return []
 
+        return self.parse_personas(response)
+
     def create_persona_models(self, research_job, personas: List[PersonaData]):
         """Create Persona model instances.
 
@@ -161,11 +190,8 @@ IMPORTANT:
         Returns:
             List of created Persona instances
         """
-        from ..models import Persona
-
-        created = []
-        for p_data in personas:
-            persona = Persona.objects.create(
+        persona_objs = [
+            Persona(
                 research_job=research_job,
                 name=p_data.name,
                 title=p_data.title,
@@ -181,6 +207,9 @@ IMPORTANT:
                 content_preferences=p_data.content_preferences,
                 key_messages=p_data.key_messages,
             )
-            created.append(persona)
+            for p_data in personas
+        ]
 
-        return created
+        # One INSERT for the whole set instead of a round-trip per persona;
+        # PKs are client-side UUIDs, so the returned instances are complete.
+        return Persona.objects.bulk_create(persona_objs, batch_size=100)
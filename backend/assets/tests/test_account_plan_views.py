@@ -8,6 +8,12 @@ from research.models import ResearchJob
 from assets.models import AccountPlan, Persona, OnePager
 
 
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    """Keep generated HTML mirrors out of the real media tree."""
+    settings.MEDIA_ROOT = str(tmp_path)
+
+
 @pytest.fixture
 def api_client():
     return APIClient()
@@ -363,3 +369,20 @@ class TestOnePagerListView:
         assert response.status_code == 200
         assert len(response.data) == 1
         assert response.data[0]["title"] == "Acme Pager"
+
+
+@pytest.mark.django_db
+class TestAccountPlanHtmlView:
+    def test_streams_stored_html(self, api_client, completed_job):
+        account_plan = AccountPlan.objects.create(
+            research_job=completed_job,
+            title="Account Plan: Acme Corp",
+            html_content='<!DOCTYPE html><p>stored plan</p>',
+        )
+
+        url = reverse("account-plan-html", args=[account_plan.id])
+        response = api_client.get(url)
+
+        assert response.status_code == 200
+        assert response.streaming
+        assert b"".join(response.streaming_content).decode() == account_plan.html_content
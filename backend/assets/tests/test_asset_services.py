@@ -10,6 +10,7 @@ from assets.services.account_plan import AccountPlanGenerator, AccountPlanData
 def make_mock_gemini(return_value):
     mock = MagicMock()
     mock.generate_text.return_value = return_value
+    mock.generate_text_cached_prefix.return_value = return_value
     return mock
 
 
@@ -29,6 +30,7 @@ def make_research_job():
     report.tech_partnerships = ['Microsoft Azure', 'SAP']
     report.competitive_landscape = 'AWS and Azure compete.'
     job.report = report
+    job.report_or_none = report
     return job
 
 
@@ -89,7 +91,7 @@ class TestPersonaGenerator:
     def test_generate_personas_returns_empty_on_exception(self):
         gen = PersonaGenerator()
         mock = MagicMock()
-        mock.generate_text.side_effect = Exception('API error')
+        mock.generate_text_cached_prefix.side_effect = Exception('API error')
         gen._gemini_client = mock
         result = gen.generate_personas(make_research_job())
         assert result == []
@@ -178,7 +180,7 @@ class TestOnePagerGenerator:
     def test_generate_one_pager_returns_default_on_exception(self):
         gen = OnePagerGenerator()
         mock = MagicMock()
-        mock.generate_text.side_effect = Exception('API down')
+        mock.generate_text_cached_prefix.side_effect = Exception('API down')
         gen._gemini_client = mock
         result = gen.generate_one_pager(make_research_job())
         assert isinstance(result, OnePagerData)
@@ -270,3 +272,79 @@ class TestAccountPlanGenerator:
         gen._gemini_client = make_mock_gemini(f'```json\n{json.dumps(plan_json)}\n```')
         result = gen.generate_account_plan(make_research_job())
         assert result.title == 'Test Plan'
+
+    def test_generate_account_plan_caches_identical_prompts(self):
+        gen = AccountPlanGenerator()
+        gen._gemini_client = make_mock_gemini(json.dumps({'title': 'Cached Plan'}))
+
+        first = gen.generate_account_plan(make_research_job())
+        second = gen.generate_account_plan(make_research_job())
+
+        assert first.title == 'Cached Plan'
+        assert second.title == 'Cached Plan'
+        assert gen._gemini_client.generate_text.call_count == 1
+
+
+# ── bulk_create_account_plans ─────────────────────────────────────────────────
+
+
+class TestBulkCreateAccountPlans:
+    def test_creates_plans_for_new_jobs(self, db):
+        from research.models import ResearchJob
+        from assets.models import AccountPlan
+
+        job = ResearchJob.objects.create(client_name='Acme Corp', sales_history='', status='completed')
+        gen = AccountPlanGenerator()
+        gen.bulk_create_account_plans([(job, AccountPlanData(title='Plan A'))])
+        assert AccountPlan.objects.filter(research_job=job, title='Plan A').exists()
+
+    def test_updates_existing_plan_on_conflict(self, db):
+        from research.models import ResearchJob
+        from assets.models import AccountPlan
+
+        job = ResearchJob.objects.create(client_name='Acme Corp', sales_history='', status='completed')
+        gen = AccountPlanGenerator()
+        gen.bulk_create_account_plans([(job, AccountPlanData(title='Plan A'))])
+        gen.bulk_create_account_plans([(job, AccountPlanData(title='Plan B'))])
+        assert AccountPlan.objects.filter(research_job=job).count() == 1
+        assert AccountPlan.objects.get(research_job=job).title == 'Plan B'
+
+
+# ── build_research_context ────────────────────────────────────────────────────
+
+
+class TestBuildResearchContext:
+    def test_joins_report_fields(self):
+        from assets.services.context import build_research_context
+
+        ctx = build_research_context(make_research_job())
+        assert ctx['client_name'] == 'Acme Corp'
+        assert ctx['pain_points'] == 'High costs, Manual processes'
+        assert ctx['decision_makers'] == 'Jane Doe (CIO)'
+
+    def test_memoizes_per_pk_and_updated_at(self):
+        from datetime import datetime
+        from assets.services.context import build_research_context
+
+        job = make_research_job()
+        job.pk = 'job-1'
+        job.updated_at = datetime(2026, 1, 1)
+        first = build_research_context(job)
+        assert build_research_context(job) is first
+
+        # A newer updated_at must recompute
+        job.updated_at = datetime(2026, 1, 2)
+        assert build_research_context(job) is not first
+
+    def test_handles_missing_report(self):
+        from assets.services.context import build_research_context
+        from unittest.mock import MagicMock
+
+        job = MagicMock()
+        job.client_name = 'Bare Co'
+        job.vertical = None
+        job.report = None
+        job.report_or_none = None
+        ctx = build_research_context(job)
+        assert ctx['vertical'] == 'unknown'
+        assert ctx['pain_points'] == 'Not identified'
@@ -7,6 +7,12 @@ from assets.models import OnePager, AccountPlan
 from assets.services.export import ExportService
 
 
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    """Keep generated HTML mirrors out of the real media tree."""
+    settings.MEDIA_ROOT = str(tmp_path)
+
+
 @pytest.fixture
 def research_job(db):
     return ResearchJob.objects.create(
@@ -259,3 +265,40 @@ class TestExportToPdf:
                 with patch("builtins.__import__", side_effect=ImportError("weasyprint")):
                     result = service.export_to_pdf("<html></html>", "test.pdf")
         assert result is None
+
+
+@pytest.mark.django_db
+class TestAssetHtmlFiles:
+    """Generated HTML is mirrored to MEDIA_ROOT for file-based serving."""
+
+    def test_one_pager_html_written_to_media(self, one_pager, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        from assets.services.export import ONE_PAGER_HTML_DIR, asset_html_path
+
+        service = ExportService()
+        result = service.generate_one_pager_html(one_pager)
+
+        path = asset_html_path(ONE_PAGER_HTML_DIR, one_pager.pk)
+        with open(path, encoding='utf-8') as f:
+            assert f.read() == result
+
+    def test_account_plan_html_written_to_media(self, account_plan, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        from assets.services.export import ACCOUNT_PLAN_HTML_DIR, asset_html_path
+
+        service = ExportService()
+        result = service.generate_account_plan_html(account_plan)
+
+        path = asset_html_path(ACCOUNT_PLAN_HTML_DIR, account_plan.pk)
+        with open(path, encoding='utf-8') as f:
+            assert f.read() == result
+
+    def test_no_file_written_when_persist_false(self, one_pager, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        from assets.services.export import ONE_PAGER_HTML_DIR, asset_html_path
+
+        service = ExportService()
+        service.generate_one_pager_html(one_pager, persist=False)
+
+        import os
+        assert not os.path.exists(asset_html_path(ONE_PAGER_HTML_DIR, one_pager.pk))
@@ -0,0 +1,111 @@
+"""Tests for GenerateAllAssetsView (batched asset generation)."""
+import json
+import uuid
+import pytest
+from unittest.mock import patch
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from research.models import ResearchJob
+from assets.models import Persona, OnePager, AccountPlan
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    """Keep generated HTML mirrors out of the real media tree."""
+    settings.MEDIA_ROOT = str(tmp_path)
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def completed_job(db):
+    return ResearchJob.objects.create(
+        client_name="Acme Corp",
+        sales_history="Big deal",
+        status="completed",
+        result="Research output",
+    )
+
+
+PERSONA_RESPONSE = json.dumps({
+    "personas": [{"name": "The CTO", "title": "CTO", "department": "IT",
+                  "seniority_level": "C-Level"}]
+})
+ONE_PAGER_RESPONSE = json.dumps({"title": "Acme One-Pager", "headline": "Win"})
+ACCOUNT_PLAN_RESPONSE = json.dumps({"title": "Account Plan: Acme Corp"})
+
+
+@pytest.mark.django_db
+class TestGenerateAllAssetsView:
+
+    def test_returns_404_for_missing_job(self, api_client):
+        url = reverse("assets-generate-all")
+        response = api_client.post(url, {"research_job_id": str(uuid.uuid4())}, format="json")
+        assert response.status_code == 404
+
+    def test_returns_400_for_incomplete_job(self, api_client, db):
+        job = ResearchJob.objects.create(
+            client_name="Pending Corp", sales_history="", status="pending", result=""
+        )
+        url = reverse("assets-generate-all")
+        response = api_client.post(url, {"research_job_id": str(job.id)}, format="json")
+        assert response.status_code == 400
+
+    def test_generates_all_assets_in_one_batch(self, api_client, completed_job):
+        url = reverse("assets-generate-all")
+        with patch(
+            "research.services.gemini.GeminiClient.generate_batch",
+            return_value=[PERSONA_RESPONSE, ONE_PAGER_RESPONSE, ACCOUNT_PLAN_RESPONSE],
+        ) as mock_batch:
+            response = api_client.post(
+                url, {"research_job_id": str(completed_job.id)}, format="json"
+            )
+
+        assert response.status_code == 201
+        assert mock_batch.call_count == 1
+        assert len(mock_batch.call_args[0][0]) == 3
+        assert len(response.data["personas"]) == 1
+        assert response.data["one_pager"]["title"] == "Acme One-Pager"
+        assert response.data["account_plan"]["title"] == "Account Plan: Acme Corp"
+        assert Persona.objects.filter(research_job=completed_job).count() == 1
+        assert OnePager.objects.filter(research_job=completed_job).count() == 1
+        assert AccountPlan.objects.filter(research_job=completed_job).count() == 1
+
+    def test_reuses_existing_assets_without_llm_call(self, api_client, completed_job):
+        Persona.objects.create(research_job=completed_job, name="Alex", title="CIO")
+        OnePager.objects.create(research_job=completed_job, title="Existing")
+        AccountPlan.objects.create(research_job=completed_job, title="Existing Plan")
+
+        url = reverse("assets-generate-all")
+        with patch(
+            "research.services.gemini.GeminiClient.generate_batch"
+        ) as mock_batch:
+            response = api_client.post(
+                url, {"research_job_id": str(completed_job.id)}, format="json"
+            )
+
+        assert response.status_code == 200
+        mock_batch.assert_not_called()
+        assert response.data["one_pager"]["title"] == "Existing"
+
+    def test_only_generates_missing_assets(self, api_client, completed_job):
+        OnePager.objects.create(research_job=completed_job, title="Existing")
+        AccountPlan.objects.create(research_job=completed_job, title="Existing Plan")
+
+        url = reverse("assets-generate-all")
+        with patch(
+            "research.services.gemini.GeminiClient.generate_batch",
+            return_value=[PERSONA_RESPONSE],
+        ) as mock_batch:
+            response = api_client.post(
+                url, {"research_job_id": str(completed_job.id)}, format="json"
+            )
+
+        assert response.status_code == 201
+        assert len(mock_batch.call_args[0][0]) == 1
+        assert len(response.data["personas"]) == 1
+        assert response.data["one_pager"]["title"] == "Existing"
@@ -157,6 +157,24 @@ class TestGenerateOnePagerView:
         response = api_client.post(url, {}, format="json")
         assert response.status_code == 400
 
+    def test_invalid_use_case_rejected_before_llm_call(self, api_client, completed_job):
+        url = reverse("one-pager-generate")
+        mock_generator = Mock()
+
+        with patch("assets.views.OnePagerGenerator", return_value=mock_generator):
+            response = api_client.post(
+                url,
+                {
+                    "research_job_id": str(completed_job.id),
+                    "use_case_id": str(uuid.uuid4()),
+                },
+                format="json",
+            )
+
+        assert response.status_code == 404
+        assert response.data["error"] == "Use case not found"
+        mock_generator.generate_one_pager.assert_not_called()
+
     def test_generate_calls_generator_and_returns_201(self, api_client, completed_job):
         url = reverse("one-pager-generate")
 
@@ -227,3 +245,59 @@ class TestGenerateOnePagerView:
             )
 
         mock_generator.generate_one_pager.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestOnePagerHtmlView:
+    def test_streams_stored_html(self, api_client, one_pager):
+        one_pager.html_content = '<!DOCTYPE html><p>stored</p>'
+        one_pager.save()
+
+        url = reverse("one-pager-html", args=[one_pager.id])
+        response = api_client.get(url)
+
+        assert response.status_code == 200
+        assert response.streaming
+        assert b"".join(response.streaming_content).decode() == one_pager.html_content
+
+    def test_returns_404_for_missing_one_pager(self, api_client, db):
+        url = reverse("one-pager-html", args=[uuid.uuid4()])
+        response = api_client.get(url)
+        assert response.status_code == 404
+
+    def test_serves_on_disk_copy_when_present(self, api_client, one_pager, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        from assets.services.export import ExportService
+
+        html = ExportService().generate_one_pager_html(one_pager)
+
+        url = reverse("one-pager-html", args=[one_pager.id])
+        response = api_client.get(url)
+
+        assert response.status_code == 200
+        assert b"".join(response.streaming_content).decode() == html
+
+    def test_etag_round_trip_returns_304(self, api_client, one_pager):
+        one_pager.html_content = '<!DOCTYPE html><p>stored</p>'
+        one_pager.save()
+
+        url = reverse("one-pager-html", args=[one_pager.id])
+        first = api_client.get(url)
+        etag = first["ETag"]
+        assert etag
+
+        second = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert second.status_code == 304
+
+    def test_etag_changes_with_content(self, api_client, one_pager):
+        one_pager.html_content = '<!DOCTYPE html><p>stored</p>'
+        one_pager.save()
+        url = reverse("one-pager-html", args=[one_pager.id])
+        etag = api_client.get(url)["ETag"]
+
+        one_pager.html_content = '<!DOCTYPE html><p>regenerated</p>'
+        one_pager.save()
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
@@ -205,3 +205,47 @@ class TestGeneratePersonasView:
             )
 
         mock_generator.generate_personas.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestPersonaListPagination:
+    def test_default_response_is_plain_array(self, api_client, completed_job):
+        Persona.objects.create(research_job=completed_job, name="A", title="CIO")
+        Persona.objects.create(research_job=completed_job, name="B", title="CTO")
+
+        url = reverse("persona-list")
+        response = api_client.get(url, {"research_job": str(completed_job.id)})
+
+        assert response.status_code == 200
+        assert isinstance(response.data, list)
+        assert len(response.data) == 2
+
+    def test_limit_param_returns_paginated_envelope(self, api_client, completed_job):
+        Persona.objects.create(research_job=completed_job, name="A", title="CIO")
+        Persona.objects.create(research_job=completed_job, name="B", title="CTO")
+
+        url = reverse("persona-list")
+        response = api_client.get(url, {"research_job": str(completed_job.id), "limit": 1})
+
+        assert response.status_code == 200
+        assert response.data["count"] == 2
+        assert len(response.data["results"]) == 1
+        assert response.data["next"] is not None
+
+
+@pytest.mark.django_db
+class TestPersonaListLastModified:
+    def test_last_modified_round_trip_returns_304(self, api_client, persona):
+        url = reverse("persona-list")
+        first = api_client.get(url)
+        last_modified = first["Last-Modified"]
+        assert last_modified
+
+        second = api_client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        assert second.status_code == 304
+
+    def test_no_last_modified_header_on_empty_list(self, api_client, db):
+        url = reverse("persona-list")
+        response = api_client.get(url)
+        assert response.status_code == 200
+        assert "Last-Modified" not in response
@@ -20,6 +20,9 @@ urlpatterns = [
     path('account-plans/<uuid:pk>/', views.AccountPlanDetailView.as_view(), name='account-plan-detail'),
     path('account-plans/<uuid:pk>/html/', views.AccountPlanHtmlView.as_view(), name='account-plan-html'),
 
+    # Combined generation
+    path('generate-all/', views.GenerateAllAssetsView.as_view(), name='assets-generate-all'),
+
     # Citations
     path('citations/', views.CitationListView.as_view(), name='citation-list'),
     path('citations/<uuid:pk>/', views.CitationDetailView.as_view(), name='citation-detail'),
@@ -1,6 +1,13 @@
 """Views for the assets API."""
-from django.http import HttpResponse
+import hashlib
+import os
+
+from django.db.models import Max, prefetch_related_objects
+from django.http import FileResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
 from rest_framework import generics, status
+from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.response import Response
 from rest_framework.throttling import ScopedRateThrottle
 from rest_framework.views import APIView
@@ -13,10 +20,91 @@ from .serializers import (
     GenerateAssetSerializer,
 )
 from .services import PersonaGenerator, OnePagerGenerator, AccountPlanGenerator, ExportService
+from .services.export import ACCOUNT_PLAN_HTML_DIR, ONE_PAGER_HTML_DIR, asset_html_path
 from research.models import ResearchJob
 from ideation.models import UseCase
 
 
+HTML_STREAM_CHUNK = 8192
+
+
+class OptionalLimitOffsetPagination(LimitOffsetPagination):
+    """Bound list responses when the client sends ?limit=<n>.
+
+    default_limit is deliberately unset: without a limit parameter the
+    response stays a plain array, which the frontend list sections
+    consume, while jobs with many rows can page through with
+    ?limit=50&offset=50 instead of pulling every row at once.
+    """
+
+
+def _serve_asset_html(request, subdir, model):
+    """Serve a generated document, preferring its on-disk copy.
+
+    The file path lets the WSGI server use wsgi.file_wrapper/sendfile and
+    skips re-reading the html_content text column; rows generated before
+    the disk copies existed fall back to streaming the column.
+
+    The response carries an ETag derived from the document content, so a
+    client re-fetching an unchanged document gets a headers-only 304
+    instead of the full body.
+    """
+    etag = quote_etag(hashlib.md5(model.html_content.encode()).hexdigest()[:16])
+    conditional = get_conditional_response(request, etag=etag)
+    if conditional is not None:
+        conditional['ETag'] = etag
+        return conditional
+
+    path = asset_html_path(subdir, model.pk)
+    if path and os.path.exists(path):
+        response = FileResponse(open(path, 'rb'), content_type='text/html')
+    else:
+        response = StreamingHttpResponse(
+            _stream_html(model.html_content), content_type='text/html'
+        )
+    response['ETag'] = etag
+    patch_cache_control(response, max_age=3600, private=True)
+    return response
+
+
+def _stream_html(html_content):
+    """Yield an HTML document in fixed-size slices.
+
+    Streaming lets the WSGI layer push large account plans to the client
+    chunk by chunk instead of buffering one multi-hundred-KB response
+    body string alongside the model instance.
+    """
+    for start in range(0, len(html_content), HTML_STREAM_CHUNK):
+        yield html_content[start:start + HTML_STREAM_CHUNK]
+
+
+class LastModifiedListMixin:
+    """Stamp list responses with Last-Modified and honor If-Modified-Since.
+
+    The timestamp is the newest row in the filtered queryset — one cheap
+    MAX() aggregate — so polling clients re-fetching an unchanged list
+    get a headers-only 304 instead of the serialized payload.
+    """
+
+    last_modified_field = 'updated_at'
+
+    def list(self, request, *args, **kwargs):
+        latest = self.filter_queryset(self.get_queryset()).aggregate(
+            latest=Max(self.last_modified_field)
+        )['latest']
+        last_modified = int(latest.timestamp()) if latest else None
+
+        if last_modified is not None:
+            conditional = get_conditional_response(request, last_modified=last_modified)
+            if conditional is not None:
+                return conditional
+
+        response = super().list(request, *args, **kwargs)
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified)
+        return response
+
+
 def _get_completed_job(research_job_id):
     """Fetch a completed ResearchJob or return an error Response.
 
@@ -25,7 +113,10 @@ def _get_completed_job(research_job_id):
         (None, Response) when job not found or not completed
     """
     try:
-        job = ResearchJob.objects.get(pk=research_job_id)
+        # The generators read report.* and gap_analysis.* fields; JOIN-fetch
+        # both reverse one-to-ones here so those accesses are free instead of
+        # two lazy SELECTs per generation.
+        job = ResearchJob.objects.select_related('report', 'gap_analysis').get(pk=research_job_id)
     except ResearchJob.DoesNotExist:
         return None, Response({'error': 'Research job not found'}, status=status.HTTP_404_NOT_FOUND)
     if job.status != 'completed':
@@ -33,10 +124,11 @@ def _get_completed_job(research_job_id):
     return job, None
 
 
-class PersonaListView(generics.ListAPIView):
+class PersonaListView(LastModifiedListMixin, generics.ListAPIView):
     """List personas, optionally filtered by research job."""
 
     serializer_class = PersonaSerializer
+    pagination_class = OptionalLimitOffsetPagination
 
     def get_queryset(self):
         queryset = Persona.objects.all()
@@ -90,10 +182,11 @@ class GeneratePersonasView(APIView):
         return Response(output_serializer.data, status=status.HTTP_201_CREATED)
 
 
-class OnePagerListView(generics.ListAPIView):
+class OnePagerListView(LastModifiedListMixin, generics.ListAPIView):
     """List one-pagers, optionally filtered by research job."""
 
     serializer_class = OnePagerSerializer
+    pagination_class = OptionalLimitOffsetPagination
 
     def get_queryset(self):
         queryset = OnePager.objects.all()
@@ -140,9 +233,10 @@ class GenerateOnePagerView(APIView):
                 output_serializer = OnePagerSerializer(existing)
                 return Response(output_serializer.data, status=status.HTTP_200_OK)
 
-        # Get optional use case
+        # Get optional use case — reject unknown ids here, before the
+        # multi-second Gemini call, rather than generating a generic
+        # fallback document for nonsense input.
         use_case = None
-        use_case_id = serializer.validated_data.get('use_case_id')
         if use_case_id:
             try:
                 use_case = UseCase.objects.get(pk=use_case_id)
@@ -182,13 +276,14 @@ class OnePagerHtmlView(APIView):
             export_service = ExportService()
             export_service.generate_one_pager_html(one_pager)
 
-        return HttpResponse(one_pager.html_content, content_type='text/html')
+        return _serve_asset_html(request, ONE_PAGER_HTML_DIR, one_pager)
 
 
-class AccountPlanListView(generics.ListAPIView):
+class AccountPlanListView(LastModifiedListMixin, generics.ListAPIView):
     """List account plans, optionally filtered by research job."""
 
     serializer_class = AccountPlanSerializer
+    pagination_class = OptionalLimitOffsetPagination
 
     def get_queryset(self):
         queryset = AccountPlan.objects.all()
@@ -232,7 +327,9 @@ class GenerateAccountPlanView(APIView):
             output_serializer = AccountPlanSerializer(existing)
             return Response(output_serializer.data, status=status.HTTP_200_OK)
 
-        # Generate account plan
+        # Generate account plan (prefetch so the generator reads the
+        # case studies from cache instead of firing its own query)
+        prefetch_related_objects([job], 'competitor_case_studies')
         generator = AccountPlanGenerator()
         plan_data = generator.generate_account_plan(job)
         plan = generator.create_account_plan_model(job, plan_data)
@@ -246,6 +343,81 @@ class GenerateAccountPlanView(APIView):
         return Response(output_serializer.data, status=status.HTTP_201_CREATED)
 
 
+class GenerateAllAssetsView(APIView):
+    """Generate personas, one-pager, and account plan in one request.
+
+    The three prompts go out together through GeminiClient.generate_batch,
+    so the endpoint costs one LLM round-trip's latency instead of three
+    sequential generation requests from the frontend.
+    """
+
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = 'ai_execute'
+
+    def post(self, request):
+        """Generate all assets for a research job.
+
+        Request body:
+        {
+            "research_job_id": "uuid"
+        }
+        """
+        serializer = GenerateAssetSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        job, err = _get_completed_job(serializer.validated_data['research_job_id'])
+        if err:
+            return err
+
+        prefetch_related_objects([job], 'competitor_case_studies')
+
+        persona_generator = PersonaGenerator()
+        one_pager_generator = OnePagerGenerator()
+        plan_generator = AccountPlanGenerator()
+
+        # Reuse existing assets; only missing ones cost an LLM call.
+        personas = list(Persona.objects.filter(research_job=job))
+        one_pager = OnePager.objects.filter(research_job=job).first()
+        plan = AccountPlan.objects.filter(research_job=job).first()
+
+        pending = {}
+        if not personas:
+            pending['personas'] = persona_generator.build_prompt(job)
+        if one_pager is None:
+            pending['one_pager'] = one_pager_generator.build_prompt(job)
+        if plan is None:
+            pending['account_plan'] = plan_generator.build_prompt(job)
+
+        if pending:
+            keys = list(pending)
+            responses = dict(zip(
+                keys,
+                persona_generator.gemini_client.generate_batch([pending[key] for key in keys]),
+            ))
+            export_service = ExportService()
+
+            if 'personas' in responses:
+                persona_data = persona_generator.parse_personas(responses['personas'])
+                personas = persona_generator.create_persona_models(job, persona_data)
+            if 'one_pager' in responses:
+                one_pager_data = one_pager_generator.parse_one_pager(responses['one_pager'], job)
+                one_pager = one_pager_generator.create_one_pager_model(job, one_pager_data)
+                export_service.generate_one_pager_html(one_pager)
+            if 'account_plan' in responses:
+                plan_data = plan_generator.parse_account_plan(responses['account_plan'], job)
+                plan = plan_generator.create_account_plan_model(job, plan_data)
+                export_service.generate_account_plan_html(plan)
+
+        return Response(
+            {
+                'personas': PersonaSerializer(personas, many=True).data,
+                'one_pager': OnePagerSerializer(one_pager).data if one_pager else None,
+                'account_plan': AccountPlanSerializer(plan).data if plan else None,
+            },
+            status=status.HTTP_201_CREATED if pending else status.HTTP_200_OK,
+        )
+
+
 class AccountPlanHtmlView(APIView):
     """Get account plan as HTML."""
 
@@ -262,13 +434,15 @@ class AccountPlanHtmlView(APIView):
             export_service = ExportService()
             export_service.generate_account_plan_html(plan)
 
-        return HttpResponse(plan.html_content, content_type='text/html')
+        return _serve_asset_html(request, ACCOUNT_PLAN_HTML_DIR, plan)
 
 
-class CitationListView(generics.ListCreateAPIView):
+class CitationListView(LastModifiedListMixin, generics.ListCreateAPIView):
     """List and create citations."""
 
     serializer_class = CitationSerializer
+    pagination_class = OptionalLimitOffsetPagination
+    last_modified_field = 'created_at'
 
     def get_queryset(self):
         queryset = Citation.objects.all()
@@ -129,7 +129,7 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.AllowAny',
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'backend.renderers.ORJSONRenderer',
     ],
     'DEFAULT_THROTTLE_CLASSES': [
         'rest_framework.throttling.AnonRateThrottle',
@@ -149,3 +149,11 @@ CORS_ALLOWED_ORIGINS = env('CORS_ALLOWED_ORIGINS')
 SHODAN_API_KEY = env('SHODAN_API_KEY', default='')
 MEDIA_ROOT = env('MEDIA_ROOT', default=str(BASE_DIR / 'media'))
 MEDIA_URL = '/media/'
+
+# Rendered research-report HTML cache (see assets.services.export)
+EXPORT_CACHE_DIR = env('EXPORT_CACHE_DIR', default=str(BASE_DIR / 'media' / 'export_cache'))
+
+# PDF rendering: with EXPORT_PDF_WORKERS > 0, WeasyPrint runs in a process
+# pool of that size instead of the request process.
+EXPORT_PDF_WORKERS = env.int('EXPORT_PDF_WORKERS', default=0)
+EXPORT_PDF_TIMEOUT = env.int('EXPORT_PDF_TIMEOUT', default=60)
@@ -17,7 +17,7 @@ SECRET_KEY = _secret_key
 _allowed_hosts = os.environ.get('ALLOWED_HOSTS', '')
 if not _allowed_hosts:
     raise RuntimeError('ALLOWED_HOSTS environment variable must be set in production')
-ALLOWED_HOSTS = [h.strip() for h in _allowed_hosts.split(',') if h.strip()]
+ALLOWED_HOSTS = tuple(h.strip() for h in _allowed_hosts.split(',') if h.strip())
 
 # Database - PostgreSQL via DATABASE_URL
 _database_url = os.environ.get('DATABASE_URL')
@@ -29,6 +29,9 @@ DATABASES = {
         conn_max_age=600,
     )
 }
+# Reuse persistent connections with a cheap liveness check instead of
+# paying the TLS + auth handshake on every request after a dropped link.
+DATABASES['default']['CONN_HEALTH_CHECKS'] = True
 
 # Static files
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
@@ -55,7 +58,7 @@ SECURE_HSTS_PRELOAD = True
 _cors_origins = os.environ.get('CORS_ALLOWED_ORIGINS', '')
 if not _cors_origins:
     raise RuntimeError('CORS_ALLOWED_ORIGINS environment variable must be set in production')
-CORS_ALLOWED_ORIGINS = [o.strip() for o in _cors_origins.split(',') if o.strip()]
+CORS_ALLOWED_ORIGINS = tuple(o.strip() for o in _cors_origins.split(',') if o.strip())
 
 # Logging
 LOGGING = {
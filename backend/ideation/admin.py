@@ -8,6 +8,7 @@ class UseCaseAdmin(admin.ModelAdmin):
     list_filter = ['priority', 'status', 'created_at']
     search_fields = ['title', 'description', 'business_problem']
     readonly_fields = ['id', 'created_at', 'updated_at']
+    list_select_related = ['research_job']
 
 
 @admin.register(FeasibilityAssessment)
@@ -16,6 +17,7 @@ class FeasibilityAssessmentAdmin(admin.ModelAdmin):
     list_filter = ['overall_feasibility', 'created_at']
     search_fields = ['use_case__title', 'recommendations']
     readonly_fields = ['id', 'created_at', 'updated_at']
+    list_select_related = ['use_case']
 
 
 @admin.register(RefinedPlay)
@@ -24,3 +26,4 @@ class RefinedPlayAdmin(admin.ModelAdmin):
     list_filter = ['status', 'target_vertical', 'created_at']
     search_fields = ['title', 'elevator_pitch', 'value_proposition']
     readonly_fields = ['id', 'created_at', 'updated_at']
+    list_select_related = ['use_case']
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.17 on 2026-08-27 13:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ideation', '0001_initial'),
+        ('research', '0009_add_partial_status_and_synthesis_text'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='feasibilityassessment',
+            index=models.Index(fields=['overall_feasibility'], name='ideation_fe_overall_fa0331_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='refinedplay',
+            index=models.Index(fields=['status'], name='ideation_re_status_d12990_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='refinedplay',
+            index=models.Index(fields=['target_vertical'], name='ideation_re_target__e032d0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usecase',
+            index=models.Index(fields=['research_job', 'status'], name='ideation_us_researc_d8c1fa_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usecase',
+            index=models.Index(fields=['-priority', '-impact_score', '-created_at'], name='ideation_us_priorit_fc5548_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usecase',
+            index=models.Index(fields=['status'], name='ideation_us_status_4c7927_idx'),
+        ),
+    ]
@@ -1,6 +1,7 @@
 """Models for the ideation loop module (Epic 4: AGE-18, AGE-19, AGE-20)."""
 import uuid
 from django.db import models
+from django.utils.functional import cached_property
 from research.models import ResearchJob
 
 
@@ -58,10 +59,35 @@ class UseCase(models.Model):
 
     class Meta:
         ordering = ['-priority', '-impact_score', '-created_at']
+        indexes = [
+            models.Index(fields=['research_job', 'status']),
+            models.Index(fields=['-priority', '-impact_score', '-created_at']),
+            models.Index(fields=['status']),
+        ]
 
     def __str__(self):
         return f"{self.title} ({self.status})"
 
+    # Pre-joined prompt strings: the feasibility and play-refiner
+    # services interpolate these list fields on every LLM call, so the
+    # join is done once per instance instead of once per prompt.
+
+    @cached_property
+    def expected_benefits_csv(self):
+        return ', '.join(self.expected_benefits) if self.expected_benefits else ''
+
+    @cached_property
+    def technologies_csv(self):
+        return ', '.join(self.technologies) if self.technologies else ''
+
+    @cached_property
+    def data_requirements_csv(self):
+        return ', '.join(self.data_requirements) if self.data_requirements else ''
+
+    @cached_property
+    def integration_points_csv(self):
+        return ', '.join(self.integration_points) if self.integration_points else ''
+
 
 class FeasibilityAssessment(models.Model):
     """Technical feasibility assessment for a use case (AGE-19)."""
@@ -111,6 +137,9 @@ class FeasibilityAssessment(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['overall_feasibility']),
+        ]
 
     def __str__(self):
         return f"Feasibility: {self.use_case.title} ({self.overall_feasibility})"
@@ -165,6 +194,10 @@ class RefinedPlay(models.Model):
     class Meta:
         ordering = ['-created_at']
         verbose_name_plural = 'Refined plays'
+        indexes = [
+            models.Index(fields=['status']),
+            models.Index(fields=['target_vertical']),
+        ]
 
     def __str__(self):
         return f"Play: {self.title} ({self.status})"
@@ -1,9 +1,30 @@
 """Serializers for the ideation API."""
+from copy import copy
+
 from rest_framework import serializers
 from .models import UseCase, FeasibilityAssessment, RefinedPlay
 
 
-class FeasibilityAssessmentSerializer(serializers.ModelSerializer):
+class CachedFieldsMixin:
+    """Memoize the built serializer fields per class.
+
+    DRF's get_fields() deep-copies every declared field — for
+    UseCaseSerializer that includes both nested serializers — on each
+    instantiation, which dominates list-response CPU. Build the field
+    tree once per class and hand out shallow copies; bind() only assigns
+    new attributes on the copy, so the cached originals stay pristine.
+    """
+
+    _fields_cache = {}
+
+    def get_fields(self):
+        fields = self._fields_cache.get(self.__class__)
+        if fields is None:
+            fields = self._fields_cache[self.__class__] = super().get_fields()
+        return {name: copy(field) for name, field in fields.items()}
+
+
+class FeasibilityAssessmentSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for feasibility assessments."""
 
     class Meta:
@@ -28,7 +49,7 @@ class FeasibilityAssessmentSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
-class RefinedPlaySerializer(serializers.ModelSerializer):
+class RefinedPlaySerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for refined plays."""
 
     class Meta:
@@ -52,15 +73,26 @@ class RefinedPlaySerializer(serializers.ModelSerializer):
             'created_at',
             'updated_at',
         ]
+        # RefinedPlayDetailView supports PUT/PATCH; only the
+        # server-managed columns stay read-only.
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
-class UseCaseSerializer(serializers.ModelSerializer):
+class UseCaseSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for use cases."""
 
     feasibility_assessment = FeasibilityAssessmentSerializer(read_only=True)
     refined_play = RefinedPlaySerializer(read_only=True)
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """JOIN-fetch the nested one-to-ones this serializer renders.
+
+        Without this, serializing a list of N use cases lazily fetches
+        each row's assessment and play — 2N + 1 queries instead of 1.
+        """
+        return queryset.select_related('feasibility_assessment', 'refined_play')
+
     class Meta:
         model = UseCase
         fields = [
@@ -85,6 +117,8 @@ class UseCaseSerializer(serializers.ModelSerializer):
             'created_at',
             'updated_at',
         ]
+        # UseCaseDetailView supports PUT/PATCH; only the server-managed
+        # columns stay read-only.
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
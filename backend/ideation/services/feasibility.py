@@ -1,11 +1,26 @@
 """Feasibility assessment service (AGE-19)."""
+import hashlib
 import json
 import logging
 from typing import Dict, Any
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
+
+import orjson
+
+from django.core.cache import cache
+
+from .parsing import compile_template, render_template, strip_code_fence
 
 logger = logging.getLogger(__name__)
 
+# How long to keep raw Gemini responses cached (seconds).
+RESPONSE_CACHE_TTL = 86400
+
+# One GeminiClient per worker process; fresh service instances reuse it
+# (and its keep-alive HTTP pool) instead of re-initializing the SDK per
+# request.
+_shared_gemini_client = None
+
 
 @dataclass
 class FeasibilityData:
@@ -83,55 +98,65 @@ IMPORTANT:
 - Respond ONLY with valid JSON
 '''
 
+    # Template pre-split into (literal, field) chunks at class creation,
+    # so each prompt build is one join instead of a format_map walk.
+    _PROMPT_CHUNKS = compile_template(FEASIBILITY_PROMPT)
+
     def __init__(self, gemini_client=None):
         """Initialize with optional Gemini client."""
         self._gemini_client = gemini_client
 
     @property
     def gemini_client(self):
-        """Lazy initialization of Gemini client."""
+        """Lazy initialization of Gemini client, shared across instances."""
         if self._gemini_client is None:
-            from research.services.gemini import GeminiClient
-            self._gemini_client = GeminiClient()
+            global _shared_gemini_client
+            if _shared_gemini_client is None:
+                from research.services.gemini import GeminiClient
+                _shared_gemini_client = GeminiClient()
+            self._gemini_client = _shared_gemini_client
         return self._gemini_client
 
-    def assess_feasibility(self, use_case) -> FeasibilityData:
-        """Assess feasibility of a use case.
+    def build_prompt(self, use_case) -> str:
+        """Build the feasibility prompt without calling the LLM.
 
         Args:
             use_case: UseCase model instance
 
         Returns:
-            FeasibilityData object
+            Formatted prompt string
         """
         research_job = use_case.research_job
-        report = getattr(research_job, 'report', None)
+        # Populated for free when the caller select_related the report;
+        # otherwise one SELECT, memoized per instance — never per prompt.
+        report = research_job.report_or_none
 
         context = {
             'title': use_case.title,
             'description': use_case.description,
             'business_problem': use_case.business_problem,
             'proposed_solution': use_case.proposed_solution,
-            'technologies': ', '.join(use_case.technologies) if use_case.technologies else 'Not specified',
-            'data_requirements': ', '.join(use_case.data_requirements) if use_case.data_requirements else 'Not specified',
-            'integration_points': ', '.join(use_case.integration_points) if use_case.integration_points else 'Not specified',
+            'technologies': use_case.technologies_csv or 'Not specified',
+            'data_requirements': use_case.data_requirements_csv or 'Not specified',
+            'integration_points': use_case.integration_points_csv or 'Not specified',
             'vertical': research_job.vertical or 'unknown',
             'digital_maturity': report.digital_maturity if report else 'unknown',
             'ai_adoption_stage': report.ai_adoption_stage if report else 'unknown',
         }
 
-        prompt = self.FEASIBILITY_PROMPT.format(**context)
+        return render_template(self._PROMPT_CHUNKS, context)
 
-        try:
-            response = self.gemini_client.generate_text(prompt)
+    def parse_assessment(self, response: str) -> FeasibilityData:
+        """Parse an LLM response into FeasibilityData; fallback on bad output.
 
-            # Parse JSON response
-            response_text = response.strip()
-            if response_text.startswith('```'):
-                lines = response_text.split('\n')
-                response_text = '\n'.join(lines[1:-1])
+        Args:
+            response: Raw response text from the LLM
 
-            data = json.loads(response_text)
+        Returns:
+            FeasibilityData object
+        """
+        try:
+            data = orjson.loads(strip_code_fence(response))
 
             return FeasibilityData(
                 overall_feasibility=data.get('overall_feasibility', 'medium'),
@@ -148,13 +173,92 @@ IMPORTANT:
                 next_steps=data.get('next_steps', []),
             )
 
-        except json.JSONDecodeError as e:
+        except (orjson.JSONDecodeError, json.JSONDecodeError) as e:
             logger.error(f"Failed to parse feasibility response: {e}")
             return FeasibilityData(recommendations=f"Assessment failed: {str(e)}")
+        except Exception as e:
+            logger.exception("Error parsing feasibility response")
+            return FeasibilityData(recommendations=f"Assessment failed: {str(e)}")
+
+    def assess_feasibility(self, use_case) -> FeasibilityData:
+        """Assess feasibility of a use case.
+
+        Args:
+            use_case: UseCase model instance
+
+        Returns:
+            FeasibilityData object
+        """
+        prompt = self.build_prompt(use_case)
+
+        try:
+            response = self._generate_with_cache(prompt)
         except Exception as e:
             logger.exception("Error during feasibility assessment")
             return FeasibilityData(recommendations=f"Assessment failed: {str(e)}")
 
+        return self.parse_assessment(response)
+
+    @staticmethod
+    def _cache_key(prompt: str) -> str:
+        return 'feas:' + hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+
+    def _generate_with_cache(self, prompt: str) -> str:
+        """Call Gemini for the prompt, memoizing the raw response.
+
+        The prompt is deterministic in the use case and report content,
+        so re-assessing an unchanged use case during iterative pipeline
+        runs skips the multi-second LLM call entirely.
+        """
+        key = self._cache_key(prompt)
+        response = cache.get(key)
+        if response is None:
+            response = self.gemini_client.generate_text(prompt)
+            cache.set(key, response, timeout=RESPONSE_CACHE_TTL)
+        return response
+
+    def assess_many(self, use_cases) -> list:
+        """Assess several use cases concurrently.
+
+        The prompts go out together through GeminiClient.generate_batch,
+        so assessing N use cases costs roughly one LLM round-trip's
+        latency instead of N sequential multi-second calls.
+
+        Args:
+            use_cases: iterable of UseCase model instances
+
+        Returns:
+            List of FeasibilityData in the same order as use_cases
+        """
+        use_cases = list(use_cases)
+        prompts = [self.build_prompt(uc) for uc in use_cases]
+        keys = [self._cache_key(prompt) for prompt in prompts]
+
+        # Only cache misses go out to Gemini; hits are served locally.
+        cached = cache.get_many(keys)
+        miss_indexes = [i for i, key in enumerate(keys) if key not in cached]
+        responses = [cached.get(key) for key in keys]
+
+        if miss_indexes:
+            try:
+                fresh = self.gemini_client.generate_batch(
+                    [prompts[i] for i in miss_indexes]
+                )
+            except Exception as e:
+                logger.exception("Error during batch feasibility assessment")
+                return [
+                    FeasibilityData(recommendations=f"Assessment failed: {str(e)}")
+                    for _ in use_cases
+                ]
+            for i, response in zip(miss_indexes, fresh):
+                responses[i] = response
+            cache.set_many(
+                {keys[i]: response for i, response in zip(miss_indexes, fresh)},
+                timeout=RESPONSE_CACHE_TTL,
+            )
+
+        return [self.parse_assessment(response) for response in responses]
+
     def create_assessment_model(self, use_case, feasibility_data: FeasibilityData):
         """Create FeasibilityAssessment model instance.
 
@@ -165,29 +269,78 @@ IMPORTANT:
         Returns:
             Created FeasibilityAssessment instance
         """
-        from ..models import FeasibilityAssessment
-
-        assessment, created = FeasibilityAssessment.objects.update_or_create(
-            use_case=use_case,
-            defaults={
-                'overall_feasibility': feasibility_data.overall_feasibility,
-                'overall_score': feasibility_data.overall_score,
-                'technical_complexity': feasibility_data.technical_complexity,
-                'data_availability': feasibility_data.data_availability,
-                'integration_complexity': feasibility_data.integration_complexity,
-                'scalability_considerations': feasibility_data.scalability_considerations,
-                'technical_risks': feasibility_data.technical_risks,
-                'mitigation_strategies': feasibility_data.mitigation_strategies,
-                'prerequisites': feasibility_data.prerequisites,
-                'dependencies': feasibility_data.dependencies,
-                'recommendations': feasibility_data.recommendations,
-                'next_steps': feasibility_data.next_steps,
-            }
-        )
-
-        # Update use case status
-        use_case.status = 'validated'
-        use_case.feasibility_score = feasibility_data.overall_score
-        use_case.save(update_fields=['status', 'feasibility_score'])
+        from django.db import transaction
+        from django.utils import timezone
+
+        from ..models import FeasibilityAssessment, UseCase
+
+        # FeasibilityData fields map 1:1 onto the model columns, so one
+        # asdict call replaces a hand-written field-by-field dict that
+        # had to be edited in two places per new field.
+        defaults = asdict(feasibility_data)
+
+        # First assessment is the common path: one INSERT, versus
+        # update_or_create's SELECT + write. Re-assessment does a direct
+        # UPDATE (bypasses auto_now, so stamp updated_at), and the use
+        # case status lands in the same transaction via a queryset
+        # update rather than a second save() with signals.
+        with transaction.atomic():
+            updated = FeasibilityAssessment.objects.filter(use_case=use_case).update(
+                updated_at=timezone.now(), **defaults
+            )
+            if updated:
+                assessment = FeasibilityAssessment.objects.get(use_case=use_case)
+            else:
+                assessment = FeasibilityAssessment.objects.create(use_case=use_case, **defaults)
+
+            use_case.status = 'validated'
+            use_case.feasibility_score = feasibility_data.overall_score
+            UseCase.objects.filter(pk=use_case.pk).update(
+                status='validated',
+                feasibility_score=feasibility_data.overall_score,
+                updated_at=timezone.now(),
+            )
 
         return assessment
+
+    def create_assessments(self, pairs) -> list:
+        """Persist many (use_case, feasibility_data) pairs in two statements.
+
+        bulk_create with update_conflicts upserts every assessment in
+        one round-trip, and the use-case status/score changes go through
+        one bulk_update — instead of the 2N-plus queries a loop over
+        create_assessment_model would issue.
+
+        Args:
+            pairs: iterable of (UseCase, FeasibilityData) tuples
+
+        Returns:
+            List of FeasibilityAssessment instances
+        """
+        from django.db import transaction
+
+        from ..models import FeasibilityAssessment, UseCase
+
+        pairs = list(pairs)
+        assessment_fields = [f.name for f in FeasibilityData.__dataclass_fields__.values()]
+        objs = [
+            FeasibilityAssessment(use_case=use_case, **asdict(data))
+            for use_case, data in pairs
+        ]
+
+        use_cases = []
+        for use_case, data in pairs:
+            use_case.status = 'validated'
+            use_case.feasibility_score = data.overall_score
+            use_cases.append(use_case)
+
+        with transaction.atomic():
+            assessments = FeasibilityAssessment.objects.bulk_create(
+                objs,
+                update_conflicts=True,
+                unique_fields=['use_case'],
+                update_fields=assessment_fields,
+            )
+            UseCase.objects.bulk_update(use_cases, fields=['status', 'feasibility_score'])
+
+        return assessments
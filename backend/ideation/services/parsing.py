@@ -0,0 +1,41 @@
+"""Shared parsing and templating helpers for ideation services."""
+from string import Formatter
+
+
+def compile_template(template: str):
+    """Pre-parse a str.format template into (literal, field) chunks.
+
+    str.format_map walks the template token-by-token on every call;
+    parsing it once at import time lets render_template assemble the
+    result with a single join over the pre-split chunks.
+    """
+    return [
+        (literal, field_name)
+        for literal, field_name, _spec, _conv in Formatter().parse(template)
+    ]
+
+
+def render_template(chunks, context: dict) -> str:
+    """Render chunks from compile_template against a context dict."""
+    parts = []
+    for literal, field_name in chunks:
+        parts.append(literal)
+        if field_name is not None:
+            parts.append(str(context[field_name]))
+    return ''.join(parts)
+
+
+def strip_code_fence(text: str) -> str:
+    """Strip a surrounding ``` fence from an LLM response.
+
+    Uses two index lookups and one slice instead of splitting the whole
+    response into a line list and rejoining it, which allocated O(lines)
+    intermediate strings on every call.
+    """
+    text = text.strip()
+    if text.startswith('```'):
+        first = text.find('\n')
+        last = text.rfind('```')
+        if first != -1 and last > first:
+            return text[first + 1:last].rstrip()
+    return text
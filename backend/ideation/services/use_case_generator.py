@@ -4,6 +4,8 @@ import logging
 from typing import List, Dict, Any
 from dataclasses import dataclass, field
 
+from .parsing import strip_code_fence
+
 logger = logging.getLogger(__name__)
 
 
@@ -116,12 +118,7 @@ IMPORTANT:
             response = self.gemini_client.generate_text(prompt)
 
             # Parse JSON response
-            response_text = response.strip()
-            if response_text.startswith('```'):
-                lines = response_text.split('\n')
-                response_text = '\n'.join(lines[1:-1])
-
-            data = json.loads(response_text)
+            data = json.loads(strip_code_fence(response))
             use_cases = []
 
             for uc in data.get('use_cases', []):
@@ -120,6 +120,18 @@ class TestPlayRefiner:
         assert isinstance(result, RefinedPlayData)
         assert result.title == uc.title
 
+    def test_refine_play_caches_identical_prompts(self):
+        refiner = PlayRefiner()
+        refiner._gemini_client = make_mock_gemini(json.dumps({'title': 'Cached Play'}))
+
+        uc = make_use_case()
+        first = refiner.refine_play(uc)
+        second = refiner.refine_play(uc)
+
+        assert first.title == 'Cached Play'
+        assert second.title == 'Cached Play'
+        assert refiner._gemini_client.generate_text.call_count == 1
+
     def test_refine_play_uses_feasibility_context_when_available(self):
         refiner = PlayRefiner()
         refiner._gemini_client = make_mock_gemini(json.dumps({
@@ -142,3 +154,48 @@ class TestPlayRefiner:
         call_args = refiner._gemini_client.generate_text.call_args[0][0]
         assert 'high' in call_args
         assert 'Data quality issue' in call_args
+
+
+class TestRefineMany:
+    def test_batches_prompts_through_generate_batch(self):
+        from ideation.services.play_refiner import PlayRefiner
+        import json as _json
+
+        response = _json.dumps({"title": "Batched Play"})
+        mock = MagicMock()
+        mock.generate_batch.return_value = [response, response]
+        refiner = PlayRefiner(gemini_client=mock)
+
+        results = refiner.refine_many([make_use_case(), make_use_case()])
+
+        mock.generate_batch.assert_called_once()
+        assert len(mock.generate_batch.call_args[0][0]) == 2
+        assert [r.title for r in results] == ["Batched Play", "Batched Play"]
+
+    def test_falls_back_per_use_case_when_batch_fails(self):
+        from ideation.services.play_refiner import PlayRefiner
+
+        mock = MagicMock()
+        mock.generate_batch.side_effect = RuntimeError("quota")
+        refiner = PlayRefiner(gemini_client=mock)
+
+        uc = make_use_case()
+        results = refiner.refine_many([uc])
+
+        assert len(results) == 1
+        assert results[0].title == uc.title
+
+    def test_skips_batch_call_for_cached_prompts(self):
+        from ideation.services.play_refiner import PlayRefiner
+        import json as _json
+
+        mock = MagicMock()
+        mock.generate_batch.return_value = [_json.dumps({"title": "Batched Play"})]
+        refiner = PlayRefiner(gemini_client=mock)
+
+        uc = make_use_case()
+        refiner.refine_many([uc])
+        results = refiner.refine_many([uc])
+
+        mock.generate_batch.assert_called_once()
+        assert results[0].title == "Batched Play"
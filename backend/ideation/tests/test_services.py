@@ -216,3 +216,150 @@ class TestFeasibilityService:
         svc._gemini_client = mock
         result = svc.assess_feasibility(make_use_case_mock())
         assert isinstance(result, FeasibilityData)
+
+    def test_assess_feasibility_caches_identical_prompts(self):
+        svc = FeasibilityService()
+        svc._gemini_client = make_mock_gemini(json.dumps({'overall_feasibility': 'high'}))
+
+        uc = make_use_case_mock()
+        first = svc.assess_feasibility(uc)
+        second = svc.assess_feasibility(uc)
+
+        assert first.overall_feasibility == 'high'
+        assert second.overall_feasibility == 'high'
+        assert svc._gemini_client.generate_text.call_count == 1
+
+
+class TestStripCodeFence:
+    def test_strips_json_fence(self):
+        from ideation.services.parsing import strip_code_fence
+
+        assert strip_code_fence('```json\n{"a": 1}\n```') == '{"a": 1}'
+
+    def test_strips_bare_fence(self):
+        from ideation.services.parsing import strip_code_fence
+
+        assert strip_code_fence('```\n{"a": 1}\n```') == '{"a": 1}'
+
+    def test_leaves_unfenced_text_alone(self):
+        from ideation.services.parsing import strip_code_fence
+
+        assert strip_code_fence('  {"a": 1}  ') == '{"a": 1}'
+
+
+class TestAssessMany:
+    def test_batches_prompts_through_generate_batch(self):
+        from ideation.services.feasibility import FeasibilityService
+
+        response = json.dumps({"overall_feasibility": "high", "overall_score": 0.9})
+        mock = MagicMock()
+        mock.generate_batch.return_value = [response, response]
+        service = FeasibilityService(gemini_client=mock)
+
+        use_cases = [make_use_case_mock(), make_use_case_mock()]
+        results = service.assess_many(use_cases)
+
+        mock.generate_batch.assert_called_once()
+        assert len(mock.generate_batch.call_args[0][0]) == 2
+        assert all(r.overall_feasibility == "high" for r in results)
+
+    def test_falls_back_per_use_case_when_batch_fails(self):
+        from ideation.services.feasibility import FeasibilityService
+
+        mock = MagicMock()
+        mock.generate_batch.side_effect = RuntimeError("quota")
+        service = FeasibilityService(gemini_client=mock)
+
+        results = service.assess_many([make_use_case_mock()])
+        assert len(results) == 1
+        assert 'Assessment failed' in results[0].recommendations
+
+    def test_skips_batch_call_for_cached_prompts(self):
+        mock = MagicMock()
+        mock.generate_batch.return_value = [json.dumps({'overall_feasibility': 'high'})]
+        service = FeasibilityService(gemini_client=mock)
+
+        uc = make_use_case_mock()
+        service.assess_many([uc])
+        results = service.assess_many([uc])
+
+        mock.generate_batch.assert_called_once()
+        assert results[0].overall_feasibility == 'high'
+
+
+class TestCompiledTemplates:
+    def test_render_matches_format_map(self):
+        from ideation.services.parsing import compile_template, render_template
+
+        template = 'Hello {name}, score {{literal}} is {score}'
+        context = {'name': 'Acme', 'score': '0.9'}
+        chunks = compile_template(template)
+        assert render_template(chunks, context) == template.format_map(context)
+
+    def test_feasibility_prompt_chunks_render_full_prompt(self):
+        from ideation.services.feasibility import FeasibilityService
+
+        service = FeasibilityService(gemini_client=MagicMock())
+        prompt = service.build_prompt(make_use_case_mock())
+        assert 'Respond ONLY with valid JSON' in prompt
+        assert '{title}' not in prompt
+
+
+@pytest.mark.django_db
+class TestBulkPersistence:
+    def _make_use_cases(self, n=2):
+        from research.models import ResearchJob
+        from ideation.models import UseCase
+
+        job = ResearchJob.objects.create(client_name='Bulk Co', status='completed')
+        return [
+            UseCase.objects.create(
+                research_job=job,
+                title=f'Use case {i}',
+                description='desc',
+                business_problem='problem',
+                proposed_solution='solution',
+            )
+            for i in range(n)
+        ]
+
+    def test_create_assessments_upserts_and_updates_statuses(self):
+        from ideation.models import FeasibilityAssessment
+        from ideation.services.feasibility import FeasibilityService, FeasibilityData
+
+        use_cases = self._make_use_cases()
+        service = FeasibilityService(gemini_client=MagicMock())
+        pairs = [(uc, FeasibilityData(overall_score=0.8)) for uc in use_cases]
+
+        service.create_assessments(pairs)
+
+        assert FeasibilityAssessment.objects.count() == 2
+        for uc in use_cases:
+            uc.refresh_from_db()
+            assert uc.status == 'validated'
+            assert uc.feasibility_score == 0.8
+
+        # Re-running upserts instead of violating the one-to-one
+        service.create_assessments([(use_cases[0], FeasibilityData(overall_score=0.3))])
+        assert FeasibilityAssessment.objects.count() == 2
+        use_cases[0].refresh_from_db()
+        assert use_cases[0].feasibility_score == 0.3
+
+    def test_create_plays_upserts_and_updates_statuses(self):
+        from ideation.models import RefinedPlay
+        from ideation.services.play_refiner import PlayRefiner, RefinedPlayData
+
+        use_cases = self._make_use_cases()
+        refiner = PlayRefiner(gemini_client=MagicMock())
+        pairs = [(uc, RefinedPlayData(title=uc.title)) for uc in use_cases]
+
+        refiner.create_plays(pairs)
+
+        assert RefinedPlay.objects.count() == 2
+        for uc in use_cases:
+            uc.refresh_from_db()
+            assert uc.status == 'refined'
+
+        refiner.create_plays([(use_cases[0], RefinedPlayData(title='Updated'))])
+        assert RefinedPlay.objects.count() == 2
+        assert RefinedPlay.objects.get(use_case=use_cases[0]).title == 'Updated'
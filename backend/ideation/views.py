@@ -20,7 +20,7 @@ class UseCaseListView(generics.ListAPIView):
     serializer_class = UseCaseSerializer
 
     def get_queryset(self):
-        queryset = UseCase.objects.all()
+        queryset = UseCaseSerializer.setup_eager_loading(UseCase.objects.all())
         research_job_id = self.request.query_params.get('research_job')
         if research_job_id:
             queryset = queryset.filter(research_job_id=research_job_id)
@@ -88,7 +88,21 @@ class AssessFeasibilityView(APIView):
             pk: UseCase UUID
         """
         try:
-            use_case = UseCase.objects.get(pk=pk)
+            # The service reads only these columns (plus the research
+            # job's report via the JOIN); skip the large unused text
+            # fields and the two lazy relation fetches.
+            use_case = (
+                UseCase.objects
+                .select_related('research_job__report')
+                .only(
+                    'title', 'description', 'business_problem', 'proposed_solution',
+                    'technologies', 'data_requirements', 'integration_points',
+                    'research_job__vertical',
+                    'research_job__report__digital_maturity',
+                    'research_job__report__ai_adoption_stage',
+                )
+                .get(pk=pk)
+            )
         except UseCase.DoesNotExist:
             return Response(
                 {'error': 'Use case not found'},
@@ -118,7 +132,23 @@ class RefinePlayView(APIView):
             pk: UseCase UUID
         """
         try:
-            use_case = UseCase.objects.get(pk=pk)
+            # The refiner reads only these columns (plus the report and
+            # assessment via the JOINs); skip the large unused text
+            # fields and the three lazy relation fetches.
+            use_case = (
+                UseCase.objects
+                .select_related('research_job__report', 'feasibility_assessment')
+                .only(
+                    'title', 'description', 'business_problem', 'proposed_solution',
+                    'expected_benefits', 'estimated_roi', 'time_to_value',
+                    'research_job__client_name', 'research_job__vertical',
+                    'research_job__report__digital_maturity',
+                    'feasibility_assessment__overall_feasibility',
+                    'feasibility_assessment__technical_risks',
+                    'feasibility_assessment__recommendations',
+                )
+                .get(pk=pk)
+            )
         except UseCase.DoesNotExist:
             return Response(
                 {'error': 'Use case not found'},
@@ -1,5 +1,6 @@
 import uuid
 from django.db import models
+from django.utils.functional import cached_property
 from .constants import Vertical, DigitalMaturityLevel, AIAdoptionStage
 
 
@@ -48,6 +49,28 @@ class ResearchJob(models.Model):
     def __str__(self):
         return f"Research: {self.client_name} ({self.status})"
 
+    @cached_property
+    def report_or_none(self):
+        """The related ResearchReport, or None if research produced none.
+
+        The reverse one-to-one descriptor raises RelatedObjectDoesNotExist
+        on every cold access to a missing report (getattr-with-default
+        swallows it each time); this caches the answer — including the
+        None — per instance.
+        """
+        try:
+            return self.report
+        except ResearchReport.DoesNotExist:
+            return None
+
+    @cached_property
+    def gap_analysis_or_none(self):
+        """The related GapAnalysis, or None if that stage never ran."""
+        try:
+            return self.gap_analysis
+        except GapAnalysis.DoesNotExist:
+            return None
+
 
 class ResearchReport(models.Model):
     """Structured deep research report for a client (AGE-10)."""
@@ -1,4 +1,5 @@
 """Gemini API client for deep research."""
+import hashlib
 import json
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -150,6 +151,12 @@ class GeminiClient:
     MODEL_PRO = 'gemini-2.5-pro-preview-06-05'
     MODEL_FLASH = 'gemini-2.5-flash'
 
+    # Server-side content caches registered through the caches API, keyed
+    # by (model, prefix hash). Class-level so every instance in the worker
+    # reuses a registered prefix instead of re-uploading it per call.
+    CONTENT_CACHE_TTL = '3600s'
+    _content_caches = {}
+
     # Phase 1 — grounded query prompts
 
     PROFILE_QUERY_PROMPT = '''Build a factual company profile for {client_name}.
@@ -758,11 +765,36 @@ Respond with ONLY the vertical name (e.g., "healthcare" or "finance"), nothing e
             logger.exception("Error during vertical classification")
             return 'other'
 
-    def generate_text(self, prompt: str, model: str = None) -> str:
-        """Generate text using Gemini API."""
+    def generate_batch(self, prompts: list, model: str = None) -> list:
+        """Generate text for several independent prompts concurrently.
+
+        Dispatches the prompts on a thread pool (the same pattern the
+        grounded research queries use), so total latency is the slowest
+        call instead of the sum of all calls.
+
+        Args:
+            prompts: list of prompt strings
+            model: optional model override applied to every prompt
+
+        Returns:
+            List of response texts in the same order as prompts
+        """
+        if not prompts:
+            return []
+        with ThreadPoolExecutor(max_workers=len(prompts)) as executor:
+            futures = [executor.submit(self.generate_text, prompt, model) for prompt in prompts]
+            return [future.result() for future in futures]
+
+    async def generate_text_async(self, prompt: str, model: str = None) -> str:
+        """Generate text using the SDK's async surface.
+
+        For ASGI deployments an async view can gather several of these so
+        total latency is the slowest call; WSGI callers should use
+        generate_batch, which gets the same effect from a thread pool.
+        """
         model = model or self.MODEL_FLASH
         try:
-            response = self.client.models.generate_content(
+            response = await self.client.aio.models.generate_content(
                 model=model,
                 contents=prompt,
             )
@@ -770,3 +802,114 @@ Respond with ONLY the vertical name (e.g., "healthcare" or "finance"), nothing e
         except Exception as e:
             logger.exception("Error generating text")
             raise
+
+    async def generate_batch_async(self, prompts: list, model: str = None) -> list:
+        """Async counterpart of generate_batch using asyncio.gather.
+
+        Args:
+            prompts: list of prompt strings
+            model: optional model override applied to every prompt
+
+        Returns:
+            List of response texts in the same order as prompts
+        """
+        import asyncio
+
+        if not prompts:
+            return []
+        return list(await asyncio.gather(
+            *(self.generate_text_async(prompt, model) for prompt in prompts)
+        ))
+
+    def _get_content_cache(self, model: str, prefix: str) -> Optional[str]:
+        """Return the cached_content name for a static prefix, registering it once.
+
+        Returns None (and memoizes the failure so it is not retried per
+        call) when the API rejects the cache — e.g. the prefix is below
+        the model's minimum cacheable token count.
+        """
+        key = (model, hashlib.sha256(prefix.encode()).hexdigest())
+        if key not in self._content_caches:
+            try:
+                cached = self.client.caches.create(
+                    model=model,
+                    config={'contents': [prefix], 'ttl': self.CONTENT_CACHE_TTL},
+                )
+                self._content_caches[key] = cached.name
+            except Exception as e:
+                logger.warning(f"Could not register content cache: {e}")
+                self._content_caches[key] = None
+        return self._content_caches[key]
+
+    def generate_text_cached_prefix(self, static_prefix: str, dynamic_suffix: str,
+                                    model: str = None, cache: bool = False) -> str:
+        """Generate text for a prompt whose prefix is constant across calls.
+
+        The prefix is registered once per process through the Gemini
+        caches API, so each call uploads (and is billed for) only the
+        dynamic suffix. Falls back to a plain full-prompt call whenever
+        the content cache is unavailable or has expired.
+
+        Args:
+            static_prefix: Instruction block shared by every call
+            dynamic_suffix: Per-call context appended to the prefix
+            model: Optional model override
+            cache: Whether to also use the semantic response cache
+        """
+        if cache:
+            from .semantic_cache import get_semantic_cache
+
+            cached = get_semantic_cache().get(static_prefix + dynamic_suffix)
+            if cached is not None:
+                return cached
+
+        model = model or self.MODEL_FLASH
+        cache_name = self._get_content_cache(model, static_prefix)
+        if cache_name:
+            try:
+                response = self.client.models.generate_content(
+                    model=model,
+                    contents=dynamic_suffix,
+                    config={'cached_content': cache_name},
+                )
+            except Exception as e:
+                # Likely an expired server-side cache — drop it so the next
+                # call re-registers, and answer this one with the full prompt.
+                logger.warning(f"cached_content generation failed, using full prompt: {e}")
+                key = (model, hashlib.sha256(static_prefix.encode()).hexdigest())
+                self._content_caches.pop(key, None)
+            else:
+                if cache:
+                    get_semantic_cache().set(static_prefix + dynamic_suffix, response.text)
+                return response.text
+        return self.generate_text(static_prefix + dynamic_suffix, model, cache=cache)
+
+    def generate_text(self, prompt: str, model: str = None, cache: bool = False) -> str:
+        """Generate text using Gemini API.
+
+        Args:
+            prompt: Prompt text
+            model: Optional model override
+            cache: When True, consult the semantic response cache before
+                calling the API and store the response on a miss. Cache
+                errors fall through to a normal API call.
+        """
+        if cache:
+            from .semantic_cache import get_semantic_cache
+
+            cached = get_semantic_cache().get(prompt)
+            if cached is not None:
+                return cached
+
+        model = model or self.MODEL_FLASH
+        try:
+            response = self.client.models.generate_content(
+                model=model,
+                contents=prompt,
+            )
+        except Exception as e:
+            logger.exception("Error generating text")
+            raise
+        if cache:
+            get_semantic_cache().set(prompt, response.text)
+        return response.text
@@ -0,0 +1,119 @@
+"""Semantic response cache for Gemini prompts."""
+import hashlib
+import logging
+from typing import Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+COLLECTION_NAME = 'gemini_response_cache'
+
+# A prompt whose embedding sits closer than this to a cached prompt is
+# treated as the same question and served the cached response.
+DEFAULT_DISTANCE_THRESHOLD = 0.05
+
+
+class SemanticCache:
+    """Embedding-backed cache of Gemini responses.
+
+    Lookups run in two tiers: an in-process dict keyed by the prompt hash
+    catches byte-identical regenerations for free, and a ChromaDB
+    similarity query catches near-identical prompts (same research job,
+    trivially different context) within ``distance_threshold``.
+
+    All ChromaDB failures degrade to a cache miss — the cache must never
+    turn a working LLM call into an error.
+    """
+
+    def __init__(self, persist_directory: Optional[str] = None,
+                 distance_threshold: Optional[float] = None):
+        """Initialize the cache.
+
+        Args:
+            persist_directory: Directory to persist ChromaDB data.
+                             Defaults to settings.CHROMA_PERSIST_DIR.
+            distance_threshold: Maximum embedding distance for a semantic hit.
+        """
+        self.persist_directory = persist_directory or getattr(
+            settings, 'CHROMA_PERSIST_DIR', './chroma_data'
+        )
+        self.distance_threshold = (
+            DEFAULT_DISTANCE_THRESHOLD if distance_threshold is None
+            else distance_threshold
+        )
+        self._collection = None
+        self._exact = {}
+
+    @property
+    def collection(self):
+        """Lazy initialization of the ChromaDB collection."""
+        if self._collection is None:
+            import chromadb
+            from chromadb.utils import embedding_functions
+
+            client = chromadb.PersistentClient(
+                path=self.persist_directory,
+                settings=chromadb.Settings(anonymized_telemetry=False),
+            )
+            self._collection = client.get_or_create_collection(
+                name=COLLECTION_NAME,
+                embedding_function=embedding_functions.SentenceTransformerEmbeddingFunction(
+                    model_name="all-MiniLM-L6-v2"
+                ),
+            )
+        return self._collection
+
+    @staticmethod
+    def _key(prompt: str) -> str:
+        return hashlib.blake2b(prompt.encode()).hexdigest()
+
+    def get(self, prompt: str) -> Optional[str]:
+        """Return a cached response for the prompt, or None on a miss."""
+        key = self._key(prompt)
+        response = self._exact.get(key)
+        if response is not None:
+            return response
+
+        try:
+            results = self.collection.query(
+                query_texts=[prompt],
+                n_results=1,
+                include=["metadatas", "distances"],
+            )
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {e}")
+            return None
+
+        if results['ids'][0] and results['distances'][0][0] < self.distance_threshold:
+            response = (results['metadatas'][0][0] or {}).get('response')
+            if response:
+                # Promote to the exact tier so repeats skip the embedding.
+                self._exact[key] = response
+                return response
+        return None
+
+    def set(self, prompt: str, response: str):
+        """Store a response for the prompt in both tiers."""
+        key = self._key(prompt)
+        self._exact[key] = response
+        try:
+            self.collection.add(
+                ids=[key],
+                documents=[prompt],
+                metadatas=[{'response': response}],
+            )
+        except Exception as e:
+            logger.warning(f"Semantic cache store failed: {e}")
+
+
+# One cache per worker process, shared by every GeminiClient instance.
+_semantic_cache = None
+
+
+def get_semantic_cache() -> SemanticCache:
+    """Return the process-wide SemanticCache, creating it on first use."""
+    global _semantic_cache
+    if _semantic_cache is None:
+        _semantic_cache = SemanticCache()
+    return _semantic_cache
@@ -0,0 +1,54 @@
+"""Tests for Gemini cached_content prefix support."""
+from unittest.mock import MagicMock
+
+import pytest
+
+from research.services.gemini import GeminiClient
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(GeminiClient, '_content_caches', {})
+    client = GeminiClient(api_key='test-key')
+    client._client = MagicMock()
+    return client
+
+
+class TestGenerateTextCachedPrefix:
+
+    def test_registers_prefix_once_and_sends_only_suffix(self, client):
+        client._client.caches.create.return_value.name = 'caches/abc'
+        client._client.models.generate_content.return_value.text = 'out'
+
+        assert client.generate_text_cached_prefix('STATIC', 'ctx one') == 'out'
+        assert client.generate_text_cached_prefix('STATIC', 'ctx two') == 'out'
+
+        assert client._client.caches.create.call_count == 1
+        _, kwargs = client._client.models.generate_content.call_args
+        assert kwargs['contents'] == 'ctx two'
+        assert kwargs['config'] == {'cached_content': 'caches/abc'}
+
+    def test_falls_back_to_full_prompt_when_registration_fails(self, client):
+        client._client.caches.create.side_effect = Exception('too small')
+        client._client.models.generate_content.return_value.text = 'out'
+
+        assert client.generate_text_cached_prefix('STATIC', 'ctx') == 'out'
+        # Failure is memoized: second call must not retry caches.create
+        assert client.generate_text_cached_prefix('STATIC', 'ctx') == 'out'
+        assert client._client.caches.create.call_count == 1
+
+        _, kwargs = client._client.models.generate_content.call_args
+        assert kwargs['contents'] == 'STATICctx'
+        assert 'config' not in kwargs
+
+    def test_expired_cache_is_evicted_and_full_prompt_used(self, client):
+        client._client.caches.create.return_value.name = 'caches/abc'
+        ok = MagicMock()
+        ok.text = 'out'
+        client._client.models.generate_content.side_effect = [
+            Exception('cache expired'),
+            ok,
+        ]
+
+        assert client.generate_text_cached_prefix('STATIC', 'ctx') == 'out'
+        assert GeminiClient._content_caches == {}
@@ -0,0 +1,100 @@
+"""Tests for the semantic response cache."""
+from unittest.mock import MagicMock, patch
+
+from research.services.semantic_cache import SemanticCache
+from research.services.gemini import GeminiClient
+
+
+def make_cache(collection=None):
+    cache = SemanticCache(persist_directory='/tmp/unused')
+    cache._collection = collection if collection is not None else MagicMock()
+    return cache
+
+
+class TestSemanticCache:
+
+    def test_exact_hit_skips_collection(self):
+        collection = MagicMock()
+        cache = make_cache(collection)
+        cache.set('prompt text', 'cached response')
+
+        assert cache.get('prompt text') == 'cached response'
+        collection.query.assert_not_called()
+
+    def test_semantic_hit_within_threshold(self):
+        collection = MagicMock()
+        collection.query.return_value = {
+            'ids': [['abc']],
+            'metadatas': [[{'response': 'near match'}]],
+            'distances': [[0.01]],
+        }
+        cache = make_cache(collection)
+
+        assert cache.get('slightly different prompt') == 'near match'
+
+    def test_miss_when_distance_exceeds_threshold(self):
+        collection = MagicMock()
+        collection.query.return_value = {
+            'ids': [['abc']],
+            'metadatas': [[{'response': 'far match'}]],
+            'distances': [[0.5]],
+        }
+        cache = make_cache(collection)
+
+        assert cache.get('unrelated prompt') is None
+
+    def test_collection_errors_degrade_to_miss(self):
+        collection = MagicMock()
+        collection.query.side_effect = RuntimeError('chroma down')
+        collection.add.side_effect = RuntimeError('chroma down')
+        cache = make_cache(collection)
+
+        assert cache.get('prompt') is None
+        cache.set('prompt', 'response')  # must not raise
+        assert cache.get('prompt') == 'response'  # exact tier still works
+
+
+class TestGenerateTextCaching:
+
+    def test_cache_hit_skips_api_call(self):
+        client = GeminiClient(api_key='test-key')
+        client._client = MagicMock()
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = 'cached'
+        with patch(
+            'research.services.semantic_cache.get_semantic_cache',
+            return_value=mock_cache,
+        ):
+            assert client.generate_text('prompt', cache=True) == 'cached'
+
+        client._client.models.generate_content.assert_not_called()
+
+    def test_cache_miss_calls_api_and_stores(self):
+        client = GeminiClient(api_key='test-key')
+        client._client = MagicMock()
+        client._client.models.generate_content.return_value.text = 'fresh'
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = None
+        with patch(
+            'research.services.semantic_cache.get_semantic_cache',
+            return_value=mock_cache,
+        ):
+            assert client.generate_text('prompt', cache=True) == 'fresh'
+
+        mock_cache.set.assert_called_once_with('prompt', 'fresh')
+
+    def test_cache_disabled_by_default(self):
+        client = GeminiClient(api_key='test-key')
+        client._client = MagicMock()
+        client._client.models.generate_content.return_value.text = 'fresh'
+
+        mock_cache = MagicMock()
+        with patch(
+            'research.services.semantic_cache.get_semantic_cache',
+            return_value=mock_cache,
+        ):
+            assert client.generate_text('prompt') == 'fresh'
+
+        mock_cache.get.assert_not_called()
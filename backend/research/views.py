@@ -56,6 +56,7 @@ def run_research_sync(job_id: str):
                 job.vertical = result['vertical']
             job.save()
         logger.info("Research job %s completed successfully", job_id)
+        _prewarm_report_export(job_id)
 
     except Exception as e:
         logger.exception("Research job %s failed", job_id)
@@ -65,6 +66,20 @@ def run_research_sync(job_id: str):
         job.save()
 
 
+def _prewarm_report_export(job_id: str):
+    """Render and cache the report HTML so the first export is a cache read.
+
+    Runs at the tail of the (already minutes-long) research request, so the
+    ~100ms render never lands on the user-facing export path. Best effort:
+    export failures must not fail the research job.
+    """
+    try:
+        job = ExportService.fetch_for_report(job_id)
+        ExportService().generate_research_report_html(job)
+    except Exception:
+        logger.warning("Report prewarm failed for job %s", job_id, exc_info=True)
+
+
 # Keep backward compat for iteration starts (projects/views.py imports this)
 def run_research_async(job_id: str):
     """Run research in a thread (legacy). Prefer run_research_sync."""
@@ -255,13 +270,7 @@ class ResearchPdfExportView(APIView):
     def get(self, request, pk):
         try:
             # Get job with all related data for efficient queries
-            job = ResearchJob.objects.select_related(
-                'report',
-                'gap_analysis',
-                'internal_ops',
-            ).prefetch_related(
-                'competitor_case_studies',
-            ).get(pk=pk)
+            job = ExportService.fetch_for_report(pk)
         except ResearchJob.DoesNotExist:
             return Response(
                 {'error': 'Research job not found'},